@@ -0,0 +1,16 @@
+# Gunicorn settings for the web UI - used by web_ui.py when gunicorn is installed
+
+bind = "0.0.0.0:5000"
+# One process: the app holds the bot (a thread, or a subprocess with BOT_SUBPROCESS=1)
+# and caches config in module state
+workers = 1
+# Threads let status polls and config requests run concurrently
+worker_class = "gthread"
+threads = 8
+keepalive = 5
+
+
+def worker_exit(server, worker):
+    """Stop an in-process bot before the worker's exit hooks close its browser service and log file"""
+    from web.app import shutdown_bot
+    shutdown_bot()
@@ -1,4 +1,5 @@
 import argparse
+import signal
 import sys
 import os
 import json
@@ -54,6 +55,17 @@ def main():
         # Initialize bot
         bot = TwitterBot(settings, test_mode=args.test)
 
+        # The web UI stops the bot with SIGTERM - exit the loop cleanly so state is saved
+        signal.signal(signal.SIGTERM, lambda signum, frame: bot.stop())
+
+        # First Ctrl-C stops at the next wait like SIGTERM; a second one interrupts outright
+        def on_interrupt(signum, frame):
+            logger.info("Stopping bot - press Ctrl-C again to force")
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            bot.stop()
+
+        signal.signal(signal.SIGINT, on_interrupt)
+
         # Start bot
         logger.info("Starting Twitter Reply Bot...")
         bot.run()
@@ -0,0 +1,147 @@
+import argparse
+import os
+import signal
+import sys
+import json
+from collections.abc import MutableSet
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.managers import SyncManager
+from pathlib import Path
+from loguru import logger
+
+# Add src to Python path
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
+
+from utils.dedup import BoundedSet
+
+# Recent replies shared between accounts - each account also keeps its own history
+SHARED_REPLIED_CAPACITY = 10_000
+
+
+class _LockedIdSet:
+    """BoundedSet behind a lock, hosted in the manager process for every account"""
+
+    def __init__(self, maxsize: int):
+        self._ids = BoundedSet(maxsize)
+        self._lock = threading.Lock()
+
+    def contains(self, item) -> bool:
+        with self._lock:
+            return item in self._ids
+
+    def items(self) -> list:
+        with self._lock:
+            return list(self._ids)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._ids)
+
+    def add(self, item):
+        with self._lock:
+            self._ids.add(item)
+
+    def discard(self, item):
+        with self._lock:
+            self._ids.discard(item)
+
+
+class AccountsManager(SyncManager):
+    pass
+
+
+AccountsManager.register('LockedIdSet', _LockedIdSet)
+
+
+class SharedIdSet(MutableSet):
+    """Set interface over a manager-hosted _LockedIdSet, shared by every account"""
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+
+    def __contains__(self, item):
+        return self._proxy.contains(item)
+
+    def __iter__(self):
+        return iter(self._proxy.items())
+
+    def __len__(self):
+        return self._proxy.size()
+
+    def add(self, item):
+        self._proxy.add(item)
+
+    def discard(self, item):
+        self._proxy.discard(item)
+
+
+def load_accounts(path: str):
+    """Load the list of per-account environment overrides"""
+    with open(path, 'r') as f:
+        accounts = json.load(f)
+
+    for account in accounts:
+        username = account.get('TWITTER_USERNAME')
+        if not username:
+            raise ValueError("Every account needs TWITTER_USERNAME")
+        # Chrome can't share a profile between processes - default to one per account
+        account.setdefault('PROFILE_DIR', f"browser_data_{username}")
+        account.setdefault('REPLIED_TWEETS_FILE', f"data/replied_tweets_{username}.json")
+        # Follow/like dedup state and the action journal are per account too
+        account.setdefault('STATE_DIR', f"data/{username}")
+        # Rotating one log file from several processes races - one file each
+        account.setdefault('LOG_FILE', f"logs/twitter_bot_{username}.log")
+    return accounts
+
+
+def run_account(account: dict, shared_replied, test_mode: bool) -> str:
+    """Run one bot for one account in this worker process"""
+    os.environ.update({key: str(value) for key, value in account.items()})
+
+    from bot.twitter_bot import TwitterBot
+    from config.settings import Settings
+    from utils.logger import setup_logger
+
+    settings = Settings()
+    setup_logger(settings.log_file)
+    bot = TwitterBot(settings, test_mode=test_mode, shared_replied=SharedIdSet(shared_replied))
+    signal.signal(signal.SIGTERM, lambda signum, frame: bot.stop())
+
+    logger.info(f"Starting bot for @{settings.twitter_username}")
+    bot.run()
+    return settings.twitter_username
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the Twitter Reply Bot for several accounts in parallel')
+    parser.add_argument('--accounts', default='accounts.json',
+                        help='JSON list of per-account environment overrides (TWITTER_USERNAME, TWITTER_PASSWORD, ...)')
+    parser.add_argument('--workers', type=int, default=None, help='Max accounts running at once (default: all)')
+    parser.add_argument('--test', action='store_true', help='Run in test mode')
+    args = parser.parse_args()
+
+    accounts = load_accounts(args.accounts)
+    workers = args.workers or len(accounts)
+
+    with AccountsManager() as manager:
+        # Tweets recently replied to by any account are skipped by all of them
+        shared_replied = manager.LockedIdSet(SHARED_REPLIED_CAPACITY)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(run_account, account, shared_replied, args.test): account['TWITTER_USERNAME']
+                for account in accounts
+            }
+            for future in as_completed(futures):
+                username = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"Bot for @{username} exited")
+                except Exception as e:
+                    logger.error(f"Bot for @{username} crashed: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,11 @@ Contains the main TwitterBot class and supporting components
 from .twitter_bot import TwitterBot
 from .selenium_manager import SeleniumManager
 from .reply_generator import ReplyGenerator
+from .driver_pool import SeleniumManagerPool
 
 __all__ = [
     'TwitterBot',
     'SeleniumManager',
-    'ReplyGenerator'
+    'ReplyGenerator',
+    'SeleniumManagerPool'
 ]
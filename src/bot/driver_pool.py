@@ -0,0 +1,123 @@
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from loguru import logger
+from config.settings import Settings
+from bot.selenium_manager import SeleniumManager
+
+
+class SeleniumManagerPool:
+    """Keeps up to `size` warm SeleniumManager instances and hands them out
+
+    Managers are created lazily on checkout and reused after release, so Chrome
+    startup (and login, with a persistent profile) is paid once per slot rather
+    than once per task. Sessions that stop responding are discarded on release.
+    """
+
+    def __init__(self, settings: Settings, size: int = 1, credentials: Optional[Dict[str, str]] = None):
+        self.settings = settings
+        self.size = size
+        # login() kwargs for browsers that start logged out (e.g. throwaway parallel profiles)
+        self.credentials = credentials
+        self._idle: "deque[SeleniumManager]" = deque()
+        self._created = 0
+        # Guards _idle and _created; notified whenever a manager is returned or a
+        # slot frees up, so waiters re-check both instead of waiting on one queue
+        self._cond = threading.Condition()
+
+    def checkout(self, timeout: Optional[float] = None) -> SeleniumManager:
+        """Take an idle manager, starting a new one if the pool isn't full yet
+
+        Raises queue.Empty if none becomes available within timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._idle:
+                    manager = self._idle.popleft()
+                    break
+                if self._created < self.size:
+                    self._created += 1
+                    manager = None
+                    break
+                # Pool is full - wait for another task to release a manager or a slot
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._cond.wait(remaining)
+
+        try:
+            if manager is None:
+                manager = SeleniumManager(self.settings)
+                if not manager.setup_driver():
+                    raise RuntimeError("Failed to setup WebDriver for pool")
+                logger.info(f"Started pooled WebDriver {self._created}/{self.size}")
+            self._ensure_logged_in(manager)
+        except Exception:
+            if manager is not None:
+                manager.close()
+            self._free_slot()
+            raise
+
+        return manager
+
+    def _ensure_logged_in(self, manager: SeleniumManager):
+        """Log a pooled browser in if it isn't already - cycles on a logged-out page find nothing"""
+        # is_logged_in() is cached briefly, so reused managers rarely pay for a probe
+        if manager.is_logged_in():
+            return
+        if manager.navigate_to_twitter_home() and manager.is_logged_in():
+            return
+
+        if not self.credentials:
+            raise RuntimeError("Pooled WebDriver is not logged in and the pool has no credentials")
+        logger.info("Logging in pooled WebDriver...")
+        if not (manager.navigate_to_twitter() and manager.login(**self.credentials)):
+            raise RuntimeError("Failed to login pooled WebDriver")
+
+    def _free_slot(self):
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    def release(self, manager: SeleniumManager):
+        """Return a manager to the pool, discarding it if its session is stale"""
+        if manager.is_driver_alive():
+            with self._cond:
+                self._idle.append(manager)
+                self._cond.notify()
+            return
+
+        logger.warning("Discarding stale pooled WebDriver")
+        manager.close()
+        self._free_slot()
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[SeleniumManager]:
+        """Context manager form: `with pool.acquire() as manager: ...`"""
+        manager = self.checkout(timeout)
+        try:
+            yield manager
+        finally:
+            self.release(manager)
+
+    def close(self):
+        """Close every idle manager"""
+        while True:
+            with self._cond:
+                if not self._idle:
+                    break
+                manager = self._idle.popleft()
+            manager.close()
+            self._free_slot()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit with cleanup"""
+        self.close()
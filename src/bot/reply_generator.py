@@ -1,14 +1,42 @@
 from google import genai
 import google.genai as genai
+import httpx
+import re
+import json
 import random
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence
 from loguru import logger
 
+
+@lru_cache(maxsize=32)
+def _keyword_pattern(keywords: tuple) -> Optional["re.Pattern[str]"]:
+    """One case-insensitive regex matching any of the keywords, or None if there are none"""
+    keywords = [k for k in keywords if k]
+    if not keywords:
+        return None
+    # Longest first so overlapping keywords can't shadow each other
+    alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(alternation, re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def get_client(api_key: str) -> genai.Client:
+    """One Gemini client per API key, so its keep-alive connections are reused"""
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    return genai.Client(api_key=api_key, http_options={'client_args': {'limits': limits}})
+
+
+def _matches_any(text: str, keywords: Iterable[str]) -> bool:
+    """Whether text contains any keyword, in a single regex scan"""
+    pattern = _keyword_pattern(tuple(keywords))
+    return pattern is not None and pattern.search(text) is not None
+
 class ReplyGenerator:
     def __init__(self, api_key: str, model: str = "gemini-2.0-flash"):
 
         self.model_name = model
-        self.client = genai.Client(api_key=api_key)
+        self.client = get_client(api_key)
 
 
         # Simple custom replies by keyword
@@ -18,17 +46,40 @@ class ReplyGenerator:
 
         }
 
-    def generate_reply(self, tweet_text: str, keywords: List[str], max_length: int = 280) -> Optional[str]:
+    def _custom_reply(self, tweet_lower: str, keywords: Sequence[str]) -> Optional[str]:
+        """Canned reply for the first custom keyword in the tweet, if any"""
+        # One regex scan rules out the common case of no custom keyword at all
+        custom = [k for k in keywords if k.lower() in self.custom_replies]
+        if _matches_any(tweet_lower, custom):
+            for keyword in custom:
+                if keyword.lower() in tweet_lower:
+                    reply = random.choice(self.custom_replies[keyword.lower()])
+                    logger.info(f"Custom reply for '{keyword}': {reply}")
+                    return reply
+        return None
+
+    @staticmethod
+    def _clean_reply(reply: str, max_length: int) -> str:
+        """Strip wrapping quotes and fit the reply into Twitter's character limit"""
+        reply = reply.strip()
+
+        # Remove quotes if Gemini adds them
+        if reply.startswith('"') and reply.endswith('"'):
+            reply = reply[1:-1]
+
+        # Ensure it's within Twitter's character limit
+        if len(reply) > max_length:
+            reply = reply[:max_length-3] + "..."
+        return reply
+
+    def generate_reply(self, tweet_text: str, keywords: Sequence[str], max_length: int = 280) -> Optional[str]:
         """Generate an appropriate reply based on tweet content and keywords"""
         try:
             tweet_lower = tweet_text.lower()
             # Check if any keyword matches and return custom reply
-            for keyword in keywords:
-                if keyword.lower() in tweet_lower:
-                    if keyword.lower() in self.custom_replies:
-                        reply = random.choice(self.custom_replies[keyword.lower()])
-                        logger.info(f"Custom reply for '{keyword}': {reply}")
-                        return reply
+            reply = self._custom_reply(tweet_lower, keywords)
+            if reply:
+                return reply
 
             prompt = f'Write a brief, engaging reply to this tweet but do not include non-BMP Characters : "{tweet_lower}"'
 
@@ -37,16 +88,7 @@ class ReplyGenerator:
                 contents=prompt
             )
             if response and response.text:
-                reply = response.text.strip()
-
-                # Remove quotes if Gemini adds them
-                if reply.startswith('"') and reply.endswith('"'):
-                    reply = reply[1:-1]
-
-                # Ensure it's within Twitter's character limit
-                if len(reply) > max_length:
-                    reply = reply[:max_length-3] + "..."
-
+                reply = self._clean_reply(response.text, max_length)
                 logger.info(f"Generated AI reply: {reply}...")
                 return reply
 
@@ -59,15 +101,52 @@ class ReplyGenerator:
             logger.error(f"Failed to generate reply: {e}")
             return None
 
-    def should_reply_to_tweet(self, tweet_text: str, keywords: List[str]) -> bool:
-        """Determine if we should reply to this tweet"""
+    def generate_replies(self, tweet_texts: List[str], keywords: Sequence[str], max_length: int = 280) -> List[Optional[str]]:
+        """Replies for several tweets, with all model-written ones from a single request
+
+        Falls back to one generate_reply call per tweet if the batched
+        response can't be parsed.
+        """
+        replies = [self._custom_reply(text.lower(), keywords) for text in tweet_texts]
+        todo = [i for i, reply in enumerate(replies) if reply is None]
+        if not todo:
+            return replies
+        if len(todo) == 1:
+            replies[todo[0]] = self.generate_reply(tweet_texts[todo[0]], keywords, max_length)
+            return replies
+
         try:
-            tweet_lower = tweet_text.lower()
+            numbered = "\n".join(f'{n}. "{tweet_texts[i].lower()}"' for n, i in enumerate(todo, 1))
+            prompt = (
+                "Write a brief, engaging reply to each of these tweets but do not include non-BMP Characters. "
+                f"Answer with a JSON array of {len(todo)} strings, one reply per tweet, in order:\n{numbered}"
+            )
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config={"response_mime_type": "application/json"}
+            )
+            generated = json.loads(response.text)
+            if not isinstance(generated, list) or len(generated) != len(todo):
+                raise ValueError(f"expected {len(todo)} replies, got {generated!r:.100}")
 
+            for i, reply in zip(todo, generated):
+                replies[i] = self._clean_reply(str(reply), max_length) or "Thanks for sharing!"
+            logger.info(f"Generated {len(todo)} AI replies in one request")
+            return replies
+
+        except Exception as e:
+            logger.warning(f"Batched reply generation failed, generating one by one: {e}")
+            for i in todo:
+                replies[i] = self.generate_reply(tweet_texts[i], keywords, max_length)
+            return replies
+
+    def should_reply_to_tweet(self, tweet_text: str, keywords: Sequence[str]) -> bool:
+        """Determine if we should reply to this tweet"""
+        try:
             # Check if tweet contains any of our keywords
-            for keyword in keywords:
-                if keyword.lower() in tweet_lower:
-                    return True
+            if _matches_any(tweet_text, keywords):
+                return True
 
             # Additional checks
             # Avoid replying to retweets
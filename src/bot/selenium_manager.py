@@ -2,25 +2,667 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.common.utils import free_port, is_connectable
 from selenium.common.exceptions import TimeoutException, WebDriverException
 import os
+import atexit
+import signal
+import subprocess
+import threading
 import tempfile
+import shutil
+import socket
 from pathlib import Path
 import time
 import random
 from loguru import logger
 from config.settings import Settings
-from typing import Optional
-from urllib.parse import quote_plus
+from utils.helpers import tweet_key, fast_send_keys, safe_send_keys
+from typing import List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+from functools import lru_cache
+import json
+import cProfile
+import pstats
+import io
+
+# Locators and selector lists, built once at import instead of on every call
+_TWEET_SELECTOR = '[data-testid="tweet"]'
+_USER_CELL_SELECTOR = '[data-testid="UserCell"]'
+_REPLY_BUTTON = (By.CSS_SELECTOR, '[data-testid="reply"]')
+
+_USERNAME_INPUT = (By.CSS_SELECTOR, 'input[autocomplete="username"]')
+_EMAIL_INPUT = (By.CSS_SELECTOR, 'input[data-testid="ocfEnterTextTextInput"]')
+_PASSWORD_INPUT = (By.CSS_SELECTOR, 'input[autocomplete="current-password"]')
+_EMAIL_OR_PASSWORD_INPUT = (
+    By.CSS_SELECTOR, 'input[data-testid="ocfEnterTextTextInput"], input[autocomplete="current-password"]'
+)
+_LOGIN_BUTTON = (By.CSS_SELECTOR, '[data-testid="LoginForm_Login_Button"]')
+_NEW_TWEET_BUTTON = (By.CSS_SELECTOR, '[data-testid="SideNav_NewTweet_Button"]')
+_HOME_READY = (By.CSS_SELECTOR, '[data-testid="primaryColumn"], input[autocomplete="username"]')
+_TWEETS_READY = (By.CSS_SELECTOR, '[data-testid="tweet"], [data-testid="emptyState"]')
+_FOLLOWERS_READY = (By.CSS_SELECTOR, '[data-testid="UserCell"], [data-testid="emptyState"]')
+
+# Root for per-instance profile copies when running in parallel
+_PARALLEL_DATA_ROOT = "browser_data_cache"
+_PROFILE_NAME = "TwitterBot"
+
+# Profile entries that carry the logged-in session (cookies are encrypted
+# with the key in "Local State")
+_PROFILE_STATE_FILES = (
+    "Local State",
+    f"{_PROFILE_NAME}/Cookies",
+    f"{_PROFILE_NAME}/Network",
+    f"{_PROFILE_NAME}/Local Storage",
+    f"{_PROFILE_NAME}/Preferences",
+)
+
+# Where profile_mode writes its cProfile stats
+_PROFILE_STATS_FILE = "selenium_profile.pstats"
+
+# Browser disk cache size (100 MB)
+_DISK_CACHE_BYTES = 100 * 1024 * 1024
+
+# How long a cached chromedriver path is trusted without checking Chrome's version
+_DRIVER_CACHE_TTL = 24 * 3600
+
+# How long a confirmed login is trusted before is_logged_in probes the DOM again
+# (TwitterBot also skips re-checking its session until then)
+_LOGIN_CACHE_TTL = 300
+
+# Requests the bot never needs - blocked via CDP to speed up every navigation
+_BLOCKED_URL_PATTERNS = (
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp",
+    "*.mp4", "*.webm", "*.m3u8",
+    "*.woff", "*.woff2", "*.ttf",
+    "pbs.twimg.com/media/*",
+    "pbs.twimg.com/profile_images/*",
+    "video.twimg.com/*",
+)
+
+# Common overlay close selectors
+_OVERLAY_SELECTORS = (
+    '[data-testid="app-bar-close"]',
+    '[aria-label="Close"]',
+    '[data-testid="mask"]',
+    '.r-1p0dtai',  # Common Twitter overlay class
+    '[role="button"][aria-label*="Close"]'
+)
+
+# Elements that indicate we're logged in
+_LOGIN_INDICATORS = (
+    '[data-testid="SideNav_NewTweet_Button"]',  # Tweet button
+    '[data-testid="AppTabBar_Home_Link"]',       # Home tab
+    '[data-testid="primaryColumn"]',             # Main timeline
+    '[aria-label="Home timeline"]',              # Timeline aria label
+    '[data-testid="SideNav_AccountSwitcher_Button"]'  # Profile menu
+)
+
+# Login form elements, joined for a single querySelector
+_LOGIN_FORM_SELECTOR = 'input[autocomplete="username"], [data-testid="LoginForm_Login_Button"]'
+
+# Element-based end-of-timeline indicators
+_TIMELINE_END_SELECTORS = (
+    '[data-testid="emptyState"]',
+    '.css-1dbjc4n.r-1loqt21',  # Common empty state classes
+    '[aria-label*="end"]',
+    '[aria-label*="caught up"]'
+)
+
+# Text-based end-of-timeline indicators, matched case-insensitively by one XPath
+_TIMELINE_END_PHRASES = (
+    "you're all caught up",
+    "nothing more to load",
+    "end of timeline",
+    "no more tweets"
+)
+_TIMELINE_END_XPATH = "//text()[{}]".format(" or ".join(
+    f"contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), \"{phrase}\")"
+    for phrase in _TIMELINE_END_PHRASES
+))
+
+# True if a text node matches the XPath in arguments[0] or a visible element
+# matches any selector in arguments[1] - evaluated in the page, no DOM transfer
+_TIMELINE_END_JS = """
+if (document.evaluate(arguments[0], document, null, XPathResult.BOOLEAN_TYPE, null).booleanValue) return true;
+return Array.from(document.querySelectorAll(arguments[1].join(', '))).some(e => e.offsetParent !== null);
+"""
+
+# Async: scrolls to the bottom, waits arguments[0] ms for tweets to load, then
+# resolves {height, at_end} using the same end-of-timeline test as above
+_SCROLL_AND_PROBE_JS = """
+const [pauseMs, xpath, selectors, done] = arguments;
+window.scrollTo(0, document.body.scrollHeight);
+setTimeout(() => {
+    const atEnd = document.evaluate(xpath, document, null, XPathResult.BOOLEAN_TYPE, null).booleanValue
+        || Array.from(document.querySelectorAll(selectors.join(', '))).some(e => e.offsetParent !== null);
+    done({height: document.body.scrollHeight, at_end: atEnd});
+}, pauseMs);
+"""
+
+_TEXTAREA_SELECTORS = (
+    '[data-testid="tweetTextarea_0"]',
+    '[data-testid="tweetTextarea_1"]',
+    'div[role="textbox"][data-testid*="tweetTextarea"]',
+    'div[contenteditable="true"][role="textbox"]'
+)
+
+_SUBMIT_SELECTORS = (
+    '[data-testid="tweetButtonInline"]',
+    '[data-testid="tweetButton"]',
+    'div[role="button"][data-testid*="tweet"]'
+)
+
+_SUCCESS_SELECTORS = (
+    '[data-testid="toast"]',  # Success toast
+    '[role="alert"]',         # Success alert
+)
+
+# Clicks the first visible and enabled element among the given selectors,
+# returning the index of the selector that matched or -1
+_CLICK_FIRST_ENABLED_JS = """
+function(selectors) {
+    for (let i = 0; i < selectors.length; i++) {
+        for (const el of document.querySelectorAll(selectors[i])) {
+            if (el.offsetParent === null || el.disabled || el.getAttribute('aria-disabled') === 'true') {
+                continue;
+            }
+            el.click();
+            return i;
+        }
+    }
+    return -1;
+}
+"""
+
+# Clicks the first visible, enabled match of each overlay selector and
+# returns how many were clicked
+_DISMISS_OVERLAYS_JS = """
+let count = 0;
+for (const selector of arguments[0]) {
+    for (const el of document.querySelectorAll(selector)) {
+        if (el.offsetParent === null || el.disabled) continue;
+        el.click();
+        count++;
+        break;
+    }
+}
+return count;
+"""
+
+# Returns [element, selectorIndex] for the first visible match among the
+# given selectors (tried in order), or null
+_FIRST_VISIBLE_JS = """
+const selectors = arguments[0];
+for (let i = 0; i < selectors.length; i++) {
+    for (const el of document.querySelectorAll(selectors[i])) {
+        if (el.offsetParent !== null) return [el, i];
+    }
+}
+return null;
+"""
+
+# Returns the first visible, enabled button whose text is exactly arguments[0],
+# or null. The login flow's Next button has no stable data-testid.
+_BUTTON_BY_TEXT_JS = """
+for (const b of document.querySelectorAll('button, [role="button"]')) {
+    if (b.offsetParent === null || b.disabled || b.getAttribute('aria-disabled') === 'true') continue;
+    if (b.innerText.trim() === arguments[0]) return b;
+}
+return null;
+"""
+
+# Scrolls arguments[0] to the viewport center and clicks it if it is then
+# fully visible, enabled and not covered by another element. Returns whether
+# it clicked.
+_SCROLL_AND_CLICK_JS = """
+const el = arguments[0];
+el.scrollIntoView({block: 'center', inline: 'center'});
+const r = el.getBoundingClientRect();
+if (!(r.top >= 0 && r.bottom <= window.innerHeight && r.width > 0)) return false;
+if (el.disabled || el.getAttribute('aria-disabled') === 'true') return false;
+const hit = document.elementFromPoint(r.left + r.width / 2, r.top + r.height / 2);
+if (!hit || !el.contains(hit)) return false;
+el.click();
+return true;
+"""
+
+# Async: scrolls arguments[0] into view, pauses arguments[1] ms like a person
+# would, clicks it, then resolves true once its data-testid flips (like ->
+# unlike, follow -> unfollow) or false after arguments[2] ms
+_CLICK_AND_CONFIRM_JS = """
+const [el, pauseMs, timeoutMs, done] = arguments;
+const before = el.getAttribute('data-testid');
+el.scrollIntoView({block: 'center'});
+setTimeout(() => {
+    el.click();
+    const start = Date.now();
+    (function check() {
+        if (!el.isConnected || el.getAttribute('data-testid') !== before) return done(true);
+        if (Date.now() - start > timeoutMs) return done(false);
+        setTimeout(check, 100);
+    })();
+}, pauseMs);
+"""
+
+# Scrolls to the bottom (or by arguments[1] pixels) and returns the last element
+# matching arguments[0] before the scroll, so callers can wait for newer content
+_SCROLL_FOR_MORE_JS = """
+const found = document.querySelectorAll(arguments[0]);
+if (arguments[1] == null) {
+    window.scrollTo(0, document.body.scrollHeight);
+} else {
+    window.scrollBy(0, arguments[1]);
+}
+return found.length ? found[found.length - 1] : null;
+"""
+
+# True once the last element matching arguments[0] is no longer arguments[1]
+_LAST_CHANGED_JS = """
+const found = document.querySelectorAll(arguments[0]);
+return found.length > 0 && found[found.length - 1] !== arguments[1];
+"""
+
+# Returns {text, username, element, reply_button} for up to arguments[0]
+# rendered tweets that have text, an author link and a reply button
+_EXTRACT_TWEETS_JS = """
+const limit = arguments[0] == null ? Infinity : arguments[0];
+const tweets = [];
+for (const tweet of document.querySelectorAll('[data-testid="tweet"]')) {
+    if (tweets.length >= limit) break;
+    const text = tweet.querySelector('[data-testid="tweetText"]');
+    const user = tweet.querySelector('[data-testid="User-Name"] a');
+    const reply = tweet.querySelector('[data-testid="reply"]');
+    if (!text || !user || !reply) continue;
+    tweets.push({
+        text: text.innerText,
+        username: (user.getAttribute('href') || '').split('/').pop(),
+        element: tweet,
+        reply_button: reply
+    });
+}
+return tweets;
+"""
+
+# Returns {element, username, follow_button} for every rendered user cell;
+# username is null without an author link, follow_button null unless a
+# visible Follow button is present
+_EXTRACT_USER_CELLS_JS = """
+return Array.from(document.querySelectorAll('[data-testid="UserCell"]'), cell => {
+    const user = cell.querySelector('[data-testid="User-Name"] a');
+    const follow = cell.querySelector('[data-testid="follow"]');
+    return {
+        element: cell,
+        username: user ? (user.getAttribute('href') || '').split('/').pop() : null,
+        follow_button: follow && follow.offsetParent !== null ? follow : null
+    };
+});
+"""
+
+# Returns {element, username, like_button, liked, text} for every rendered
+# tweet; username/like_button are null when missing, text is null without
+# a text node
+_EXTRACT_POSTS_JS = """
+return Array.from(document.querySelectorAll('[data-testid="tweet"]'), tweet => {
+    const user = tweet.querySelector('[data-testid="User-Name"] a');
+    const like = tweet.querySelector('[data-testid="like"]');
+    const text = tweet.querySelector('[data-testid="tweetText"]');
+    return {
+        element: tweet,
+        username: user ? (user.getAttribute('href') || '').split('/').pop() : null,
+        like_button: like,
+        liked: like !== null && like.classList.contains('r-1777fci'),
+        text: text ? text.innerText : null
+    };
+});
+"""
+
+# Installs a MutationObserver resolving window.__botSuccessSeen once a node
+# matching any of the given selectors is inserted
+_WATCH_SUCCESS_JS = """
+const selectors = arguments[0].join(', ');
+if (window.__botSuccessObserver) window.__botSuccessObserver.disconnect();
+window.__botSuccessSeen = new Promise(resolve => {
+    window.__botSuccessObserver = new MutationObserver(mutations => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType === 1 && (node.matches(selectors) || node.querySelector(selectors))) {
+                    window.__botSuccessObserver.disconnect();
+                    resolve(true);
+                    return;
+                }
+            }
+        }
+    });
+    window.__botSuccessObserver.observe(document.body, {childList: true, subtree: true});
+});
+"""
+
+# Async script: waits for the observer above or gives up after arguments[0] ms
+_AWAIT_SUCCESS_JS = """
+const done = arguments[arguments.length - 1];
+const timeout = new Promise(resolve => setTimeout(() => resolve(false), arguments[0]));
+Promise.race([window.__botSuccessSeen || Promise.resolve(false), timeout]).then(seen => {
+    if (window.__botSuccessObserver) window.__botSuccessObserver.disconnect();
+    done(seen);
+});
+"""
+
+def _profile_in_use(user_data_dir: Path) -> bool:
+    """Check whether a live Chrome process holds the profile's SingletonLock"""
+    lock = user_data_dir / "SingletonLock"
+    if not os.path.lexists(lock):
+        return False
+
+    # On Linux/macOS the lock is a symlink to "<hostname>-<pid>"; a lock left
+    # by a crashed process is stale and Chrome will take it over
+    try:
+        host, _, pid = os.readlink(lock).rpartition("-")
+        if host != socket.gethostname():
+            return True
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (OSError, ValueError):
+        return True
+    return True
+
+
+@lru_cache(maxsize=256)
+def _build_search_url(query: str) -> str:
+    """Build the live search URL for a query ("home" maps to the home timeline)"""
+    if query == "home":
+        return "https://x.com"
+    return "https://x.com/search?" + urlencode({'q': query, 'src': 'typed_query', 'f': 'live'})
+
+
+def _get_chrome_major_version() -> Optional[str]:
+    """Read the installed Chrome major version from the OS (no network access)"""
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logger.debug(f"Could not determine Chrome version: {e}")
+        return None
+    return version.split('.')[0] if version else None
+
+
+@lru_cache(maxsize=1)
+def _resolve_driver_path() -> str:
+    """Return a chromedriver path, only calling ChromeDriverManager().install() on a cache miss
+
+    The resolved path is stored in a sidecar file in the WebDriverManager cache
+    directory, keyed by Chrome's major version. A sidecar younger than
+    _DRIVER_CACHE_TTL is trusted without probing the Chrome version, and the
+    result is memoized for the rest of the process.
+    """
+    sidecar = Path(os.environ.get('WDM_CACHE_DIR', tempfile.gettempdir())) / 'driver_path.json'
+
+    try:
+        if time.time() - sidecar.stat().st_mtime < _DRIVER_CACHE_TTL:
+            driver_path = json.loads(sidecar.read_text()).get('driver_path', '')
+            if os.path.exists(driver_path):
+                logger.debug(f"Using recently cached chromedriver: {driver_path}")
+                return driver_path
+    except (OSError, ValueError):
+        pass  # No usable cache yet
+
+    chrome_major = _get_chrome_major_version()
+
+    try:
+        cached = json.loads(sidecar.read_text())
+        driver_path = cached.get('driver_path', '')
+        if chrome_major and cached.get('chrome_major') == chrome_major and os.path.exists(driver_path):
+            logger.debug(f"Using cached chromedriver for Chrome {chrome_major}: {driver_path}")
+            sidecar.touch()  # Version still matches - trust it for another TTL
+            return driver_path
+    except (OSError, ValueError):
+        pass  # No usable cache yet
+
+    driver_path = ChromeDriverManager().install()
+
+    try:
+        sidecar.write_text(json.dumps({'chrome_major': chrome_major, 'driver_path': driver_path}))
+    except OSError as e:
+        logger.warning(f"Could not cache chromedriver path: {e}")
+
+    return driver_path
+
+
+# One chromedriver process shared by every SeleniumManager in this process
+_shared_service: Optional[Service] = None
+_shared_service_lock = threading.Lock()
+
+
+def _get_shared_service(options: Options) -> Service:
+    """Start chromedriver once and hand the running service to every caller"""
+    global _shared_service
+
+    with _shared_service_lock:
+        service = _shared_service
+        if service is not None and service.process is not None and service.process.poll() is None:
+            return service
+
+        # Setup service with proper logging
+        try:
+            # Reuse the cached chromedriver unless Chrome's major version changed
+            driver_path = _resolve_driver_path()
+
+            service = Service(
+                driver_path,
+                log_path=os.devnull if os.name != 'nt' else 'NUL'
+            )
+        except Exception as e:
+            logger.warning(f"ChromeDriverManager failed, trying system Chrome: {e}")
+            service = Service()
+            service.path = DriverFinder.get_path(service, options)
+
+        service.start()
+        atexit.register(service.stop)
+        logger.info(f"Started shared chromedriver service at {service.service_url}")
+
+        _shared_service = service
+        return service
+
+
+# Browser sessions being shut down in the background
+_pending_quits: List[threading.Thread] = []
+_pending_quits_lock = threading.Lock()
+
+
+# How long a relaunch waits for the previous browser to release its profile
+_QUIT_JOIN_TIMEOUT = 30.0
+
+
+def _join_pending_quits(timeout: float = 2.0):
+    """Wait (bounded) for background quits to finish - before exit or a relaunch"""
+    with _pending_quits_lock:
+        threads = list(_pending_quits)
+
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    with _pending_quits_lock:
+        _pending_quits[:] = [t for t in _pending_quits if t.is_alive()]
+
+
+def _quit_in_background(driver: webdriver.Chrome):
+    """Quit a driver on a daemon thread so the caller doesn't wait for Chrome to exit"""
+    def _quit():
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error during driver cleanup: {e}")
+
+    thread = threading.Thread(target=_quit, name="driver-quit", daemon=True)
+    with _pending_quits_lock:
+        # Drop finished threads; register the exit hook on first use so it runs
+        # before the shared service's stop hook (atexit is LIFO)
+        if not _pending_quits:
+            atexit.unregister(_join_pending_quits)
+            atexit.register(_join_pending_quits)
+        _pending_quits[:] = [t for t in _pending_quits if t.is_alive()]
+        _pending_quits.append(thread)
+    thread.start()
+
+
+# Keep-alive sockets each driver holds open to chromedriver. urllib3 defaults to
+# one, so a command issued while another thread's is in flight opened a socket
+# and threw it away afterwards
+_DRIVER_CONNECTIONS = 4
+
+
+class _KeepAliveConnection(ChromiumRemoteConnection):
+    """ChromiumRemoteConnection whose keep-alive pool holds several sockets"""
+
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw['maxsize'] = _DRIVER_CONNECTIONS
+        return manager
+
+
+class _SharedServiceChrome(webdriver.Chrome):
+    """Chrome driver attached to an already running chromedriver service
+
+    Unlike webdriver.Chrome it neither starts nor stops the service, so the
+    chromedriver process outlives individual browser sessions.
+    """
+
+    def __init__(self, service: Service, options: Options, keep_alive: bool = True):
+        self.vendor_prefix = "goog"
+        self.service = service
+
+        RemoteWebDriver.__init__(
+            self,
+            command_executor=_KeepAliveConnection(
+                remote_server_addr=service.service_url,
+                browser_name=DesiredCapabilities.CHROME["browserName"],
+                vendor_prefix=self.vendor_prefix,
+                keep_alive=keep_alive,
+                ignore_proxy=options._ignore_local_proxy,
+            ),
+            options=options,
+        )
+        self._is_remote = False
+
+    def quit(self) -> None:
+        """End the browser session, leaving the shared service running"""
+        try:
+            RemoteWebDriver.quit(self)
+        except Exception:
+            pass
+
+
+# Chromedriver URL and session id of the browser left running for the next start
+# Per account, so bots sharing a state_dir never re-attach to each other's browser
+_SESSION_FILE = "browser_session_{username}.json"
+
+
+def _start_detached_chromedriver() -> Tuple[str, int]:
+    """Start a chromedriver that outlives this process and return its URL and PID"""
+    port = free_port()
+    if os.name == 'nt':
+        detach = {'creationflags': subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        detach = {'start_new_session': True}
+    process = subprocess.Popen(
+        [_resolve_driver_path(), f"--port={port}"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        **detach
+    )
+
+    deadline = time.monotonic() + 10
+    while not is_connectable(port):
+        if time.monotonic() > deadline:
+            process.kill()
+            raise WebDriverException(f"Detached chromedriver did not start on port {port}")
+        time.sleep(0.1)
+    return f"http://localhost:{port}", process.pid
+
+
+def _kill_detached_chromedriver(pid: Optional[int]):
+    """Kill a chromedriver started by an earlier run that no longer answers"""
+    if not pid:
+        return
+    try:
+        os.kill(pid, signal.SIGTERM)
+        logger.info(f"Killed unresponsive detached chromedriver (pid {pid})")
+    except OSError:
+        pass  # Already gone
+
+
+class _PersistentChrome(webdriver.Chrome):
+    """Chrome driver on a detached chromedriver, optionally attached to an existing session
+
+    It is never quit, so the browser keeps running between bot restarts and the
+    next start re-attaches instead of launching Chrome and loading the profile.
+    """
+
+    def __init__(self, executor_url: str, options: Options, session_id: Optional[str] = None):
+        self.vendor_prefix = "goog"
+        self.service = None
+        self._attach_session_id = session_id
+
+        RemoteWebDriver.__init__(
+            self,
+            command_executor=_KeepAliveConnection(
+                remote_server_addr=executor_url,
+                browser_name=DesiredCapabilities.CHROME["browserName"],
+                vendor_prefix=self.vendor_prefix,
+                keep_alive=True,
+                ignore_proxy=options._ignore_local_proxy,
+            ),
+            options=options,
+        )
+        self._is_remote = False
+
+    def start_session(self, capabilities: dict) -> None:
+        """Adopt the given session id instead of creating a session, when there is one"""
+        if self._attach_session_id is None:
+            super().start_session(capabilities)
+            return
+        self.session_id = self._attach_session_id
+        self.caps = {}
+
+    def quit(self) -> None:
+        """End the browser session; the detached chromedriver keeps running"""
+        try:
+            RemoteWebDriver.quit(self)
+        except Exception:
+            pass
+
 
 class SeleniumManager:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+        # Same timeout, 100ms polling - for elements expected within a few hundred ms
+        self.fast_wait: Optional[WebDriverWait] = None
+
+        # Selectors that matched on the previous reply, tried first next time
+        self._preferred_textarea_selector: Optional[str] = None
+        self._preferred_submit_selector: Optional[str] = None
+
+        # Monotonic time of the last confirmed logged-in state
+        self._login_cache_ts: float = float("-inf")
+
+        # Optional profiler covering this manager's lifetime, dumped on close()
+        self._profiler: Optional[cProfile.Profile] = None
+        if settings.profile_mode:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
         self._setup_webdriver_env()
 
     def _setup_webdriver_env(self):
@@ -34,6 +676,36 @@ class SeleniumManager:
         os.makedirs(cache_dir, exist_ok=True)
         os.environ['WDM_CACHE_DIR'] = cache_dir
 
+    @property
+    def _drv(self) -> webdriver.Chrome:
+        """The live driver, set up on first use"""
+        driver = self.driver
+        if driver is None:
+            self._ensure_initialized()
+            driver = self.driver
+            assert driver is not None
+        return driver
+
+    @property
+    def _wait(self) -> WebDriverWait:
+        """The default explicit wait, set up with the driver on first use"""
+        wait = self.wait
+        if wait is None:
+            self._ensure_initialized()
+            wait = self.wait
+            assert wait is not None
+        return wait
+
+    @property
+    def _fast_wait(self) -> WebDriverWait:
+        """The 100ms-polling explicit wait, set up with the driver on first use"""
+        fast_wait = self.fast_wait
+        if fast_wait is None:
+            self._ensure_initialized()
+            fast_wait = self.fast_wait
+            assert fast_wait is not None
+        return fast_wait
+
     def _ensure_initialized(self) -> None:
         """Ensure driver and wait are initialized, raise error if not"""
         if not self.driver or not self.wait:
@@ -48,60 +720,35 @@ class SeleniumManager:
     def setup_driver(self):
         """Initialize Chrome WebDriver with appropriate options"""
         try:
-            chrome_options = Options()
-
-            # Create persistent user data directory
-            user_data_dir = Path("browser_data")
-            user_data_dir.mkdir(exist_ok=True)
-            chrome_options.add_argument(f"--user-data-dir={user_data_dir.absolute()}")
-
-            # Profile directory for session persistence
-            chrome_options.add_argument("--profile-directory=TwitterBot")
-
-            # Basic options
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-notifications")
-            chrome_options.add_argument("--disable-popup-blocking")
-            chrome_options.add_argument("--disable-logging")
-            chrome_options.add_argument("--log-level=3")
-            chrome_options.add_argument("--silent")
-
-            # Prevent cleanup issues
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-
-            # User agent to avoid detection
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-            # Headless mode if configured
-            if self.settings.headless_mode:
-                chrome_options.add_argument("--headless=new")  # Use new headless mode
-                chrome_options.add_argument("--window-size=1920,1080")
-
-            # Setup service with proper logging
-            try:
-                # Use ChromeDriverManager with proper configuration
-                driver_path = ChromeDriverManager().install()
+            # Bound each chromedriver HTTP command so a hung browser can't block forever
+            RemoteConnection.set_timeout(self.settings.browser_timeout + self.settings.page_load_timeout)
 
-                service = Service(
-                    driver_path,
-                    log_path=os.devnull if os.name != 'nt' else 'NUL'
-                )
-            except Exception as e:
-                logger.warning(f"ChromeDriverManager failed, trying system Chrome: {e}")
-                service = Service()
+            # With persist_session, pick up the browser the previous run left open
+            self.driver = self._attach_saved_session() if self._persistent else None
+
+            if self.driver is None:
+                chrome_options = self._build_chrome_options()
+                if self._persistent:
+                    self.driver = self._launch_persistent_session(chrome_options)
+                else:
+                    # Attach to the process-wide chromedriver service (started on first use)
+                    service = _get_shared_service(chrome_options)
+
+                    # Create driver with error handling - keep_alive reuses one pooled
+                    # connection to chromedriver instead of a new socket per command
+                    self.driver = _SharedServiceChrome(service=service, options=chrome_options, keep_alive=True)
 
-            # Create driver with error handling
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.set_page_load_timeout(self.settings.page_load_timeout)
-            self.driver.implicitly_wait(10)
+            # No implicit wait: it compounds with WebDriverWait and makes every
+            # negative find_elements probe block. Explicit waits do the waiting.
+            self.driver.implicitly_wait(0)
+
+            if self.settings.block_media:
+                self._block_media_requests()
 
             # Setup WebDriverWait
-            self.wait = WebDriverWait(self.driver, self.settings.browser_timeout)
+            self.wait = WebDriverWait(self.driver, self.settings.browser_timeout, poll_frequency=0.25)
+            self.fast_wait = WebDriverWait(self.driver, self.settings.browser_timeout, poll_frequency=0.1)
 
             logger.info("Chrome WebDriver initialized successfully")
             return True
@@ -111,16 +758,182 @@ class SeleniumManager:
             self._cleanup_driver()
             return False
 
+    def _build_chrome_options(self) -> Options:
+        """Chrome options for a new browser session"""
+        chrome_options = Options()
+
+        # Persistent user data directory, or a per-instance copy of it when
+        # several bots run side by side
+        user_data_dir = self._prepare_user_data_dir()
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir.absolute()}")
+
+        # Profile directory for session persistence
+        chrome_options.add_argument(f"--profile-directory={_PROFILE_NAME}")
+
+        # The default "eager" returns from driver.get() at DOMContentLoaded instead of
+        # waiting for every subresource; each navigation is followed by an explicit wait
+        chrome_options.page_load_strategy = self.settings.page_load_strategy
+
+        # Basic options
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--disable-popup-blocking")
+        chrome_options.add_argument("--disable-logging")
+        chrome_options.add_argument("--log-level=3")
+        chrome_options.add_argument("--silent")
+        chrome_options.add_argument("--disable-sync")
+        # Room for X's JS bundles so warm starts load them from the HTTP/V8 code cache
+        chrome_options.add_argument(f"--disk-cache-size={_DISK_CACHE_BYTES}")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+
+        # Prevent cleanup issues
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+
+        # User agent to avoid detection
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+        if self.settings.proxy_server:
+            chrome_options.add_argument(f"--proxy-server={self.settings.proxy_server}")
+
+        # Headless mode if configured
+        if self.settings.headless_mode:
+            chrome_options.add_argument("--headless=new")  # Use new headless mode
+            chrome_options.add_argument("--window-size=1920,1080")
+
+        # Don't render images - the bot only reads text and clicks buttons
+        if self.settings.block_media:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2
+            })
+
+        return chrome_options
+
+    @property
+    def _persistent(self) -> bool:
+        """Whether the browser is kept running across restarts (parallel instances never are)"""
+        return self.settings.persist_session and not self.settings.allow_parallel
+
+    @property
+    def _session_file(self) -> Path:
+        """Where this account's re-attach info is saved"""
+        return Path(self.settings.state_dir) / _SESSION_FILE.format(username=self.settings.twitter_username)
+
+    def _saved_session(self) -> dict:
+        """What _launch_persistent_session saved last time, empty if nothing usable"""
+        try:
+            saved = json.loads(self._session_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return saved if isinstance(saved, dict) else {}
+
+    def _attach_saved_session(self) -> Optional[webdriver.Chrome]:
+        """Re-attach to the browser session saved by _launch_persistent_session, if it is still alive"""
+        saved = self._saved_session()
+        try:
+            driver = _PersistentChrome(saved['executor'], Options(), session_id=saved['session_id'])
+            driver.current_url  # raises if the browser or chromedriver is gone
+        except Exception as e:
+            logger.debug(f"No browser session to re-attach to: {e}")
+            return None
+
+        logger.info("Re-attached to the browser session from the previous run")
+        return driver
+
+    def _launch_persistent_session(self, options: Options) -> webdriver.Chrome:
+        """Start a browser on a detached chromedriver and save how to re-attach to it
+
+        The previous run's chromedriver is reused while it still answers, and
+        killed otherwise, so relaunches don't leave orphaned drivers behind.
+        """
+        saved = self._saved_session()
+        executor, pid = saved.get('executor'), saved.get('pid')
+        port = urlsplit(executor).port if isinstance(executor, str) else None
+        if port is None or not is_connectable(port):
+            _kill_detached_chromedriver(pid)
+            executor, pid = _start_detached_chromedriver()
+
+        driver = _PersistentChrome(executor, options)
+        session_file = self._session_file
+        session_file.parent.mkdir(parents=True, exist_ok=True)
+        session_file.write_text(json.dumps({
+            'executor': driver.command_executor._url,
+            'session_id': driver.session_id,
+            'pid': pid
+        }), encoding='utf-8')
+        return driver
+
+    def _prepare_user_data_dir(self) -> Path:
+        """Return the Chrome user data dir to launch with
+
+        Sequential runs share the persistent profile, failing fast if another
+        live Chrome holds it. With allow_parallel, each instance gets a throwaway
+        copy of the persistent profile's login state, removed at exit.
+        """
+        master_dir = Path(self.settings.profile_dir)
+        master_dir.mkdir(exist_ok=True)
+
+        # A browser being quit in the background still holds the profile's lock
+        _join_pending_quits(_QUIT_JOIN_TIMEOUT)
+
+        if not self.settings.allow_parallel:
+            if _profile_in_use(master_dir):
+                raise RuntimeError(
+                    f"Browser profile {master_dir} is in use by another Chrome instance; "
+                    "set ALLOW_PARALLEL=true to run several bots at once"
+                )
+            return master_dir
+
+        cache_root = Path(_PARALLEL_DATA_ROOT)
+        cache_root.mkdir(exist_ok=True)
+        instance_dir = Path(tempfile.mkdtemp(prefix="twbot_", dir=cache_root))
+        atexit.register(shutil.rmtree, instance_dir, ignore_errors=True)
+
+        # Copy only what carries the session - the rest of the profile is cache
+        for name in _PROFILE_STATE_FILES:
+            src = master_dir / name
+            dst = instance_dir / name
+            try:
+                if src.is_dir():
+                    shutil.copytree(src, dst)
+                elif src.is_file():
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(src, dst)
+            except OSError as e:
+                logger.warning(f"Could not copy {src} into instance profile: {e}")
+
+        logger.info(f"Using per-instance browser profile {instance_dir}")
+        return instance_dir
+
+    def _block_media_requests(self):
+        """Block image, video and font requests at the network layer via CDP"""
+        if not self.driver:
+            return
+
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
+            logger.debug("Blocking {} media URL patterns", len(_BLOCKED_URL_PATTERNS))
+        except WebDriverException as e:
+            logger.warning(f"Could not enable media blocking: {e}")
+
     def _cleanup_driver(self):
         """Safely cleanup driver resources"""
         if self.driver:
             try:
-                self.driver.quit()
-            except Exception as e:
-                logger.warning(f"Error during driver cleanup: {e}")
+                # A persistent browser is left running for the next start to re-attach to
+                if not self._persistent:
+                    _quit_in_background(self.driver)
             finally:
                 self.driver = None
                 self.wait = None
+                self.fast_wait = None
+                self._login_cache_ts = float("-inf")
 
     def _safe_click(self, element):
         """Safely click element using JavaScript if regular click fails"""
@@ -133,68 +946,109 @@ class SeleniumManager:
             logger.warning(f"Regular click failed, trying JavaScript click: {e}")
             self.driver.execute_script("arguments[0].click();", element)
 
+    def _cdp_click_first(self, selectors) -> Optional[str]:
+        """Click the first visible, enabled element matching the selectors via CDP
+
+        Selectors are tried in order inside a single Runtime.evaluate call,
+        bypassing WebDriver element resolution. Returns the selector that
+        matched, or None so it can be polled as a WebDriverWait condition.
+        """
+        if not self.driver:
+            raise RuntimeError("WebDriver not initialized")
+
+        response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': f"({_CLICK_FIRST_ENABLED_JS})({json.dumps(list(selectors))})",
+            'returnByValue': True
+        })
+        index = response.get('result', {}).get('value', -1)
+        return selectors[index] if index >= 0 else None
+
+    def _first_visible(self, selectors) -> Optional[tuple]:
+        """Find the first visible element among selectors (in order) with one script call
+
+        Returns (element, selector) or None, so it can be polled as a WebDriverWait condition.
+        """
+        if not self.driver:
+            raise RuntimeError("WebDriver not initialized")
+
+        match = self.driver.execute_script(_FIRST_VISIBLE_JS, list(selectors))
+        if not match:
+            return None
+        element, index = match
+        return element, selectors[index]
+
+    def _button_by_text(self, text: str):
+        """Find a visible, enabled button by its exact text with one script call"""
+        if not self.driver:
+            raise RuntimeError("WebDriver not initialized")
+
+        return self.driver.execute_script(_BUTTON_BY_TEXT_JS, text)
+
+    def _ensure_focused(self, element):
+        """Make sure element has focus, re-focusing it in the same call if not"""
+        if not self.driver:
+            raise RuntimeError("WebDriver not initialized")
+
+        was_focused = self.driver.execute_script("""
+            if (document.activeElement === arguments[0]) return true;
+            arguments[0].focus();
+            return false;
+        """, element)
+        if not was_focused:
+            logger.debug("Element lost focus, re-focused it")
+
     def _dismiss_overlays(self):
         """Dismiss any potential overlays or modals that might block clicks"""
         if not self.driver:
             return
 
         try:
-            # Common overlay close selectors
-            overlay_selectors = [
-                '[data-testid="app-bar-close"]',
-                '[aria-label="Close"]',
-                '[data-testid="mask"]',
-                '.r-1p0dtai',  # Common Twitter overlay class
-                '[role="button"][aria-label*="Close"]'
-            ]
-
-            for selector in overlay_selectors:
-                overlays = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for overlay in overlays:
-                    if overlay.is_displayed() and overlay.is_enabled():
-                        logger.info("Dismissing overlay")
-                        self._safe_click(overlay)
-                        time.sleep(random.uniform(0.5, 1))
-                        break
+            dismissed = self.driver.execute_script(_DISMISS_OVERLAYS_JS, list(_OVERLAY_SELECTORS))
+            if dismissed:
+                logger.info(f"Dismissed {dismissed} overlay(s)")
+                time.sleep(random.uniform(0.3, 0.6))
         except Exception as e:
             logger.debug(f"No overlays to dismiss: {e}")
 
     def navigate_to_twitter_home(self):
         """Navigate to Twitter home page to check login status"""
-        self._ensure_initialized()
-
-        driver = self.driver
-        assert driver is not None
+        driver = self._drv
+        wait = self._wait
 
         try:
             driver.get("https://x.com/home")
-            time.sleep(3)  # Wait for page to load
+
+            # Wait for either the timeline (logged in) or the login form (logged out)
+            try:
+                wait.until(EC.presence_of_element_located(_HOME_READY))
+            except TimeoutException:
+                logger.warning("Home page did not show timeline or login form in time")
             logger.info("Navigated to Twitter home page")
             return True
         except Exception as e:
             logger.error(f"Failed to navigate to Twitter home: {e}")
             return False
 
+    @property
+    def login_is_fresh(self) -> bool:
+        """Whether a logged-in state was confirmed within the last _LOGIN_CACHE_TTL seconds"""
+        return time.monotonic() - self._login_cache_ts < _LOGIN_CACHE_TTL
+
     def is_logged_in(self):
         """Check if user is currently logged in to Twitter"""
         if not self.driver:
             return False
 
+        # Skip the DOM probe if we confirmed the session recently
+        if self.login_is_fresh:
+            return True
+
         try:
             # Check for elements that indicate we're logged in
-            login_indicators = [
-                '[data-testid="SideNav_NewTweet_Button"]',  # Tweet button
-                '[data-testid="AppTabBar_Home_Link"]',       # Home tab
-                '[data-testid="primaryColumn"]',             # Main timeline
-                '[aria-label="Home timeline"]',              # Timeline aria label
-                '[data-testid="SideNav_AccountSwitcher_Button"]'  # Profile menu
-            ]
-
-            for indicator in login_indicators:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, indicator)
-                if elements and elements[0].is_displayed():
-                    logger.info("User is already logged in")
-                    return True
+            if self._first_visible(_LOGIN_INDICATORS):
+                logger.info("User is already logged in")
+                self._login_cache_ts = time.monotonic()
+                return True
 
             # Check if we're on login page (indicates we're not logged in)
             current_url = self.driver.current_url
@@ -203,20 +1057,18 @@ class SeleniumManager:
                 return False
 
             # Additional check for login form elements
-            login_elements = [
-                'input[autocomplete="username"]',
-                '[data-testid="LoginForm_Login_Button"]'
-            ]
-
-            for element in login_elements:
-                if self.driver.find_elements(By.CSS_SELECTOR, element):
-                    logger.info("User is not logged in - login form detected")
-                    return False
+            if self.driver.execute_script("return document.querySelector(arguments[0]) !== null;", _LOGIN_FORM_SELECTOR):
+                logger.info("User is not logged in - login form detected")
+                return False
 
             # If we can't determine clearly, assume not logged in for safety
             logger.warning("Could not determine login status clearly, assuming not logged in")
             return False
 
+        except WebDriverException as e:
+            self._login_cache_ts = float("-inf")
+            logger.error(f"Error checking login status: {e}")
+            return False
         except Exception as e:
             logger.error(f"Error checking login status: {e}")
             return False
@@ -230,11 +1082,7 @@ class SeleniumManager:
             Raises:
                 RuntimeError: If WebDriver setup fails
             """
-            self._ensure_initialized()
-
-            # Local reference for type safety
-            driver = self.driver
-            assert driver is not None
+            driver = self._drv
 
             try:
                 driver.get("https://x.com/login")
@@ -246,65 +1094,57 @@ class SeleniumManager:
 
     def login(self, username: str, password: str, email: Optional[str] = None):
         """Login to Twitter"""
-        self._ensure_initialized()
-
-        # Local references for type safety
-        driver = self.driver
-        wait = self.wait
-        assert driver is not None
-        assert wait is not None
+        driver = self._drv
+        wait = self._wait
+        fast_wait = self._fast_wait
 
         try:
             # Wait for username input
             username_input = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[autocomplete="username"]'))
+                EC.presence_of_element_located(_USERNAME_INPUT)
             )
 
             # Enter username
             username_input.clear()
             username_input.send_keys(username)
-            time.sleep(random.uniform(1, 2))
+            time.sleep(random.uniform(0.2, 0.5))
 
             # Click Next button
-            next_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, '//span[text()="Next"]/parent::*/parent::*'))
-            )
+            next_button = fast_wait.until(lambda d: self._button_by_text("Next"))
             next_button.click()
-            time.sleep(random.uniform(2, 3))
 
-            # Handle potential email verification
-            try:
-                email_input = driver.find_element(By.CSS_SELECTOR, 'input[data-testid="ocfEnterTextTextInput"]')
-                if email_input and email:
-                    email_input.send_keys(email)
-                    next_button = wait.until(
-                        EC.element_to_be_clickable((By.XPATH, '//span[text()="Next"]/parent::*/parent::*'))
-                    )
-                    next_button.click()
-                    time.sleep(random.uniform(2, 3))
-            except:
-                pass  # Email verification not required
+            # Wait for the next step - either email verification or password
+            wait.until(EC.presence_of_element_located(_EMAIL_OR_PASSWORD_INPUT))
+
+            # Handle potential email verification - the step above already waited for
+            # whichever input renders, so a non-blocking probe is enough here
+            email_inputs = driver.find_elements(*_EMAIL_INPUT)
+            if email_inputs and email:
+                email_inputs[0].send_keys(email)
+                next_button = fast_wait.until(lambda d: self._button_by_text("Next"))
+                next_button.click()
 
             # Enter password
             password_input = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[autocomplete="current-password"]'))
+                EC.presence_of_element_located(_PASSWORD_INPUT)
             )
             password_input.clear()
             password_input.send_keys(password)
-            time.sleep(random.uniform(1, 2))
+            time.sleep(random.uniform(0.2, 0.5))
 
             # Click Login button
-            login_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, '//span[text()="Log in"]/parent::*/parent::*'))
+            login_button = fast_wait.until(
+                EC.element_to_be_clickable(_LOGIN_BUTTON)
             )
             login_button.click()
 
             # Wait for successful login
             wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="SideNav_NewTweet_Button"]'))
+                EC.presence_of_element_located(_NEW_TWEET_BUTTON)
             )
 
             logger.info("Successfully logged into Twitter")
+            self._login_cache_ts = time.monotonic()
             return True
 
         except TimeoutException as e:
@@ -316,15 +1156,17 @@ class SeleniumManager:
 
     def get_followers(self, limit: int = 50):
         """Get list of followers who are not being followed back"""
-        self._ensure_initialized()
-
-        driver = self.driver
-        assert driver is not None
+        driver = self._drv
+        wait = self._wait
 
         try:
-            # Navigate to followers page
+            # Navigate to followers page - eager page load returns at DOMContentLoaded,
+            # so wait for the user cells explicitly
             driver.get("https://x.com/followers")
-            time.sleep(random.uniform(3, 5))
+            try:
+                wait.until(EC.presence_of_element_located(_FOLLOWERS_READY))
+            except TimeoutException:
+                logger.warning("Timed out waiting for followers to render")
 
             followers_to_follow = []
             processed_count = 0
@@ -333,32 +1175,27 @@ class SeleniumManager:
             last_height = driver.execute_script("return document.body.scrollHeight")
 
             while processed_count < limit:
-                # Find follower elements
-                follower_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="UserCell"]')
+                # Extract every rendered follower cell in one script call
+                follower_cells = driver.execute_script(_EXTRACT_USER_CELLS_JS)
 
-                for element in follower_elements[processed_count:]:
+                for cell in follower_cells[processed_count:]:
                     try:
-                        # Extract username
-                        username_element = element.find_element(By.CSS_SELECTOR, '[data-testid="User-Name"] a')
-                        href = username_element.get_attribute('href')
+                        username = cell['username']
 
-                        if not href:
-                            logger.warning("Username element found but href is None, skipping")
+                        if username is None:
+                            logger.warning("Follower cell has no username link, skipping")
                             continue
 
-                        username = href.split('/')[-1]
-
                         if not username:
                             logger.warning("Empty username extracted, skipping")
                             continue
 
-                        # Check if there's a "Follow" button (meaning we're not following them)
-                        follow_buttons = element.find_elements(By.CSS_SELECTOR, '[data-testid="follow"]')
-                        if follow_buttons and follow_buttons[0].is_displayed():
+                        # A visible "Follow" button means we're not following them
+                        if cell['follow_button'] is not None:
                             followers_to_follow.append({
                                 'username': username,
-                                'element': element,
-                                'follow_button': follow_buttons[0]
+                                'element': cell['element'],
+                                'follow_button': cell['follow_button']
                             })
 
                         processed_count += 1
@@ -369,9 +1206,8 @@ class SeleniumManager:
                         logger.warning(f"Failed to process follower element: {e}")
                         continue
 
-                # Scroll down
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(random.uniform(2, 4))
+                # Scroll down and wait for more followers to render
+                self._scroll_for_more(_USER_CELL_SELECTOR, timeout=4)
 
                 # Check if we've reached the bottom
                 new_height = driver.execute_script("return document.body.scrollHeight")
@@ -386,29 +1222,22 @@ class SeleniumManager:
             logger.error(f"Failed to get followers: {e}")
             return []
 
-    def follow_user(self, user_data: dict):
-        """Follow a specific user"""
-        self._ensure_initialized()
+    def _click_and_confirm(self, button, timeout_ms: int) -> bool:
+        """Scroll to, pause on and click a toggle button in one round-trip
 
-        driver = self.driver
-        wait = self.wait
-        assert driver is not None
-        assert wait is not None
+        Returns whether the button was seen switching state afterwards.
+        """
+        pause_ms = random.randint(1000, 2000)
+        return self._drv.execute_async_script(_CLICK_AND_CONFIRM_JS, button, pause_ms, timeout_ms)
 
+    def follow_user(self, user_data: dict):
+        """Follow a specific user"""
         try:
-            follow_button = user_data['follow_button']
-
-            # Scroll to button
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", follow_button)
-            time.sleep(random.uniform(1, 2))
-
-            # Click follow button
-            self._safe_click(follow_button)
-
-            # Wait for button to change (confirmation)
-            time.sleep(random.uniform(2, 3))
+            if not self._click_and_confirm(user_data['follow_button'], timeout_ms=3000):
+                logger.warning("Follow button for @{} did not change state", user_data['username'])
+                return False
 
-            logger.info(f"Successfully followed @{user_data['username']}")
+            logger.info("Successfully followed @{}", user_data['username'])
             return True
 
         except Exception as e:
@@ -417,59 +1246,52 @@ class SeleniumManager:
 
     def get_following_posts(self, limit: int = 20):
         """Get recent posts from people we're following"""
-        self._ensure_initialized()
-
-        driver = self.driver
-        assert driver is not None
+        driver = self._drv
+        wait = self._wait
 
         try:
             # Navigate to home timeline (following feed)
             driver.get("https://x.com/home")
-            time.sleep(random.uniform(3, 5))
+            self._wait_for_tweets(wait)
 
             posts_to_like = []
             processed_count = 0
 
             # Scroll and collect posts
             while processed_count < limit:
-                tweet_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="tweet"]')
+                # Extract every rendered post in one script call
+                posts = driver.execute_script(_EXTRACT_POSTS_JS)
 
-                for element in tweet_elements[processed_count:]:
+                for post in posts[processed_count:]:
                     try:
-                        # Get username
-                        username_element = element.find_element(By.CSS_SELECTOR, '[data-testid="User-Name"] a')
-                        href = username_element.get_attribute('href')
+                        username = post['username']
 
-                        if not href:
-                            logger.warning("Username element found but href is None, skipping post")
+                        if username is None:
+                            logger.warning("Post has no username link, skipping post")
                             continue
 
-                        username = href.split('/')[-1]
-
                         if not username:
                             logger.warning("Empty username extracted, skipping post")
                             continue
 
-                        # Get like button
-                        like_button = element.find_element(By.CSS_SELECTOR, '[data-testid="like"]')
-
-                        # Check if already liked (button would have different attributes)
-                        button_class = like_button.get_attribute("class")
-                        is_liked = button_class is not None and "r-1777fci" in button_class  # Twitter's liked button class
+                        if post['like_button'] is None:
+                            logger.warning("Post has no like button, skipping post")
+                            continue
 
-                        if not is_liked:
-                            # Get tweet text for logging
-                            try:
-                                tweet_text_element = element.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]')
-                                tweet_text = tweet_text_element.text[:100] + "..." if len(tweet_text_element.text) > 100 else tweet_text_element.text
-                            except:
+                        # Already-liked buttons carry Twitter's liked class
+                        if not post['liked']:
+                            # Tweet text for logging
+                            text = post['text']
+                            if text is None:
                                 tweet_text = "[No text content]"
+                            else:
+                                tweet_text = text[:100] + "..." if len(text) > 100 else text
 
                             posts_to_like.append({
                                 'username': username,
                                 'tweet_text': tweet_text,
-                                'element': element,
-                                'like_button': like_button
+                                'element': post['element'],
+                                'like_button': post['like_button']
                             })
 
                         processed_count += 1
@@ -481,8 +1303,7 @@ class SeleniumManager:
                         continue
 
                 # Scroll down for more posts
-                driver.execute_script("window.scrollTo(0, window.scrollY + 800);")
-                time.sleep(random.uniform(2, 4))
+                self._scroll_for_more(_TWEET_SELECTOR, timeout=4, by=800)
 
             logger.info(f"Found {len(posts_to_like)} posts to like")
             return posts_to_like
@@ -493,27 +1314,12 @@ class SeleniumManager:
 
     def like_post(self, post_data: dict):
         """Like a specific post"""
-        self._ensure_initialized()
-
-        driver = self.driver
-        wait = self.wait
-        assert driver is not None
-        assert wait is not None
-
         try:
-            like_button = post_data['like_button']
-
-            # Scroll to button
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", like_button)
-            time.sleep(random.uniform(1, 2))
-
-            # Click like button
-            self._safe_click(like_button)
-
-            # Wait for animation
-            time.sleep(random.uniform(1, 2))
+            if not self._click_and_confirm(post_data['like_button'], timeout_ms=2000):
+                logger.warning("Like button for @{}'s post did not change state", post_data['username'])
+                return False
 
-            logger.info(f"Successfully liked post by @{post_data['username']}")
+            logger.info("Successfully liked post by @{}", post_data['username'])
             return True
 
         except Exception as e:
@@ -522,18 +1328,13 @@ class SeleniumManager:
 
     def search_tweets(self, query: str):
         """Search for tweets with given query"""
-        self._ensure_initialized()
-
-        # Local reference for type safety
-        driver = self.driver
-        assert driver is not None
+        driver = self._drv
+        wait = self._wait
 
         try:
             # Navigate to search page
-            base_url = "https://x.com" if query == "home" else f"https://x.com/search?q={quote_plus(query)}&src=typed_query&f=live"
-
-            driver.get(base_url)
-            time.sleep(random.uniform(3, 5))
+            driver.get(_build_search_url(query))
+            self._wait_for_tweets(wait)
 
             logger.info(f"Searched for: {query}")
             return True
@@ -544,29 +1345,16 @@ class SeleniumManager:
 
     def get_tweets(self, limit: int = 200):
         """Get tweets from current page"""
-        self._ensure_initialized()
-
-        # Local reference for type safety
-        driver = self.driver
-        assert driver is not None
+        driver = self._drv
+        wait = self._wait
 
         tweets = []
         try:
             # Wait for tweets to load
-            time.sleep(random.uniform(2, 4))
+            self._wait_for_tweets(wait)
 
-            # Find tweet elements
-            tweet_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="tweet"]')
-
-            for i, tweet_element in enumerate(tweet_elements[:limit]):
-                try:
-                    # Extract tweet data
-                    tweet_data = self._extract_tweet_data(tweet_element)
-                    if tweet_data:
-                        tweets.append(tweet_data)
-                except Exception as e:
-                    logger.warning(f"Failed to extract tweet {i}: {e}")
-                    continue
+            # Extract every tweet on the page in one script call
+            tweets = self._extract_tweets(limit)
 
             logger.info(f"Found {len(tweets)} tweets")
             return tweets
@@ -575,60 +1363,68 @@ class SeleniumManager:
             logger.error(f"Failed to get tweets: {e}")
             return []
 
-    def _extract_tweet_data(self, tweet_element):
-        """Extract data from tweet element"""
+    def _wait_for_tweets(self, wait: WebDriverWait) -> bool:
+        """Wait until tweets (or the empty-state marker) are rendered"""
         try:
-            # Get tweet text
-            tweet_text_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]')
-            tweet_text = tweet_text_element.text if tweet_text_element else ""
+            wait.until(EC.presence_of_element_located(_TWEETS_READY))
+            return True
+        except TimeoutException:
+            logger.warning("Timed out waiting for tweets to render")
+            return False
 
-            # Get username
-            username_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="User-Name"] a')
-            username = username_element.get_attribute('href').split('/')[-1] if username_element else ""
+    def _scroll_for_more(self, selector: str, timeout: float, by: Optional[int] = None) -> bool:
+        """Scroll and wait until a new last element matching selector renders
 
-            # Get reply button
-            reply_button = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="reply"]')
+        Compares element identity rather than counts because the timeline
+        virtualizes and keeps roughly the same number of tweets in the DOM.
+        Returns False if nothing new appeared within timeout.
+        """
+        if not self.driver:
+            raise RuntimeError("WebDriver not initialized")
 
-            return {
-                'text': tweet_text,
-                'username': username,
-                'element': tweet_element,
-                'reply_button': reply_button
-            }
+        last = self.driver.execute_script(_SCROLL_FOR_MORE_JS, selector, by)
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda d: d.execute_script(_LAST_CHANGED_JS, selector, last)
+            )
+            return True
+        except TimeoutException:
+            return False
 
-        except Exception as e:
+    def _extract_tweets(self, limit: Optional[int] = None) -> List[dict]:
+        """Extract text, username and element handles for rendered tweets in one script call"""
+        if not self.driver:
+            raise RuntimeError("WebDriver not initialized")
+
+        try:
+            return self.driver.execute_script(_EXTRACT_TWEETS_JS, limit) or []
+        except WebDriverException as e:
             logger.warning(f"Failed to extract tweet data: {e}")
-            return None
+            return []
 
     def get_tweets_with_scroll(self, max_tweets: int = 500, scroll_pause_time: float = 3.0):
         """Get tweets by continuously scrolling and collecting new ones"""
-        self._ensure_initialized()
-
-        driver = self.driver
-        assert driver is not None
+        driver = self._drv
 
         all_tweets = []
         processed_tweet_ids = set()
         consecutive_no_new = 0
         max_consecutive_no_new = 3
+        stalled_scrolls = 0
+        max_stalled_scrolls = 2
 
         try:
             logger.info(f"Starting to collect up to {max_tweets} tweets with scrolling...")
 
             while len(all_tweets) < max_tweets and consecutive_no_new < max_consecutive_no_new:
                 # Get current tweets on page
-                current_tweet_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="tweet"]')
+                current_tweets = self._extract_tweets()
 
                 new_tweets_found = 0
-                for element in current_tweet_elements:
+                for tweet_data in current_tweets:
                     try:
-                        # Extract basic tweet data first to create ID
-                        tweet_data = self._extract_tweet_data(element)
-                        if not tweet_data:
-                            continue
-
                         # Create unique ID
-                        tweet_id = f"{tweet_data['username']}:{hash(tweet_data['text'])}"
+                        tweet_id = tweet_key(tweet_data['username'], tweet_data['text'])
 
                         # Skip if we've already processed this tweet
                         if tweet_id in processed_tweet_ids:
@@ -647,16 +1443,22 @@ class SeleniumManager:
 
                 if new_tweets_found == 0:
                     consecutive_no_new += 1
-                    logger.info(f"No new tweets found in this scroll. Count: {consecutive_no_new}")
+                    logger.info("No new tweets found in this scroll. Count: {}", consecutive_no_new)
                 else:
                     consecutive_no_new = 0
-                    logger.info(f"Found {new_tweets_found} new tweets. Total: {len(all_tweets)}")
+                    logger.info("Found {} new tweets. Total: {}", new_tweets_found, len(all_tweets))
 
                 # Scroll down if we need more tweets
                 if len(all_tweets) < max_tweets and consecutive_no_new < max_consecutive_no_new:
                     logger.info("Scrolling for more tweets...")
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(scroll_pause_time)
+                    if self._scroll_for_more(_TWEET_SELECTOR, timeout=scroll_pause_time):
+                        stalled_scrolls = 0
+                    else:
+                        # Nothing new rendered - stop without re-extracting the same page
+                        stalled_scrolls += 1
+                        if stalled_scrolls >= max_stalled_scrolls:
+                            logger.info("Nothing new rendered after scrolling, stopping")
+                            break
 
             logger.info(f"Tweet collection completed. Found {len(all_tweets)} tweets total.")
             return all_tweets
@@ -667,16 +1469,12 @@ class SeleniumManager:
 
     def scroll_to_load_more_tweets(self, scroll_count: int = 3, pause_time: float = 3.0):
         """Scroll down multiple times to load more tweets"""
-        self._ensure_initialized()
-
-        driver = self.driver
-        assert driver is not None
+        driver = self._drv
 
         try:
             for i in range(scroll_count):
-                logger.debug(f"Scroll {i+1}/{scroll_count}")
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(pause_time)
+                logger.debug("Scroll {}/{}", i + 1, scroll_count)
+                self._scroll_for_more(_TWEET_SELECTOR, timeout=pause_time)
 
                 # Check if we've hit any end-of-timeline indicators
                 if self._check_timeline_end_indicators():
@@ -695,38 +1493,25 @@ class SeleniumManager:
             return False
 
         try:
-            # Text-based indicators
-            page_text = self.driver.page_source.lower()
-            end_phrases = [
-                "you're all caught up",
-                "nothing more to load",
-                "end of timeline",
-                "no more tweets"
-            ]
-
-            for phrase in end_phrases:
-                if phrase in page_text:
-                    return True
-
-            # Element-based indicators
-            end_elements = [
-                '[data-testid="emptyState"]',
-                '.css-1dbjc4n.r-1loqt21',  # Common empty state classes
-                '[aria-label*="end"]',
-                '[aria-label*="caught up"]'
-            ]
-
-            for selector in end_elements:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and any(el.is_displayed() for el in elements):
-                    return True
-
-            return False
+            # Text and element indicators in one script call, instead of pulling page_source
+            return bool(self.driver.execute_script(
+                _TIMELINE_END_JS, _TIMELINE_END_XPATH, list(_TIMELINE_END_SELECTORS)
+            ))
 
         except Exception as e:
             logger.debug(f"Error checking timeline end indicators: {e}")
             return False
 
+    def scroll_timeline(self, pause: float) -> dict:
+        """Scroll to the bottom, let tweets load for `pause` seconds, return {height, at_end}
+
+        Scrolling, the height read and the end-of-timeline check share one round-trip.
+        """
+        driver = self._drv
+        return driver.execute_async_script(
+            _SCROLL_AND_PROBE_JS, int(pause * 1000), _TIMELINE_END_XPATH, list(_TIMELINE_END_SELECTORS)
+        )
+
     def get_current_scroll_position(self):
         """Get current scroll position"""
         if not self.driver:
@@ -762,13 +1547,9 @@ class SeleniumManager:
 
     def reply_to_tweet(self, tweet_data: dict, reply_text: str):
         """Reply to a specific tweet with enhanced error handling"""
-        self._ensure_initialized()
-
-        # Local references for type safety
-        driver = self.driver
-        wait = self.wait
-        assert driver is not None
-        assert wait is not None
+        driver = self._drv
+        wait = self._wait
+        fast_wait = self._fast_wait
 
         try:
             # Dismiss any potential overlays first
@@ -777,149 +1558,109 @@ class SeleniumManager:
             # Get reply button
             reply_button = tweet_data['reply_button']
 
-            # Enhanced scrolling - scroll to center of viewport
-            driver.execute_script("""
-                arguments[0].scrollIntoView({
-                    behavior: 'smooth',
-                    block: 'center',
-                    inline: 'center'
-                });
-            """, reply_button)
-
-            # Wait longer for any animations to complete
-            time.sleep(random.uniform(2, 4))
-
-            # Wait specifically for this reply button to be clickable
-            try:
-                # Wait for the specific reply button to be clickable
-                wait.until(lambda d: reply_button.is_displayed() and reply_button.is_enabled())
-
-                # Additional check - wait for element to be clickable using EC
-                clickable_reply = wait.until(
-                    EC.element_to_be_clickable(reply_button)
-                )
-
-            except TimeoutException:
-                logger.warning("Reply button not immediately clickable, trying alternative approach")
-                # Try finding reply button again by tweet element
+            # Scroll to center of viewport and click in one call if it landed in view uncovered
+            logger.debug("Attempting to click reply button for @{}", tweet_data['username'])
+            if not driver.execute_script(_SCROLL_AND_CLICK_JS, reply_button):
+                # Wait specifically for this reply button to be clickable
                 try:
-                    tweet_element = tweet_data['element']
-                    clickable_reply = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="reply"]')
-                except:
-                    raise Exception("Could not locate clickable reply button")
+                    clickable_reply = fast_wait.until(
+                        EC.element_to_be_clickable(reply_button)
+                    )
 
-            # Dismiss overlays again in case any appeared during scroll
-            self._dismiss_overlays()
+                except TimeoutException:
+                    logger.warning("Reply button not immediately clickable, trying alternative approach")
+                    # Try finding reply button again by tweet element
+                    try:
+                        tweet_element = tweet_data['element']
+                        clickable_reply = tweet_element.find_element(*_REPLY_BUTTON)
+                    except:
+                        raise Exception("Could not locate clickable reply button")
+
+                # Dismiss overlays again in case any appeared during scroll
+                self._dismiss_overlays()
 
-            # Try safe click
-            logger.info(f"Attempting to click reply button for @{tweet_data['username']}")
-            self._safe_click(clickable_reply)
+                # Try safe click
+                self._safe_click(clickable_reply)
 
             # Wait for reply dialog with multiple possible selectors
             reply_textarea = None
-            textarea_selectors = [
-                '[data-testid="tweetTextarea_0"]',
-                '[data-testid="tweetTextarea_1"]',
-                'div[role="textbox"][data-testid*="tweetTextarea"]',
-                'div[contenteditable="true"][role="textbox"]'
-            ]
-
-            for selector in textarea_selectors:
-                try:
-                    reply_textarea = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"Found reply textarea with selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+            textarea_selectors = _TEXTAREA_SELECTORS
+
+            # Try the selector that worked last time first
+            preferred = self._preferred_textarea_selector
+            if preferred:
+                textarea_selectors = (preferred,) + tuple(sel for sel in textarea_selectors if sel != preferred)
+
+            # One script call per poll checks every selector
+            try:
+                reply_textarea, selector = fast_wait.until(lambda d: self._first_visible(textarea_selectors))
+                logger.debug("Found reply textarea with selector: {}", selector)
+                self._preferred_textarea_selector = selector
+            except TimeoutException:
+                reply_textarea = None
 
             if not reply_textarea:
                 raise Exception("Could not find reply textarea")
 
             # Wait for textarea to be interactive
-            wait.until(EC.element_to_be_clickable(reply_textarea))
+            fast_wait.until(EC.element_to_be_clickable(reply_textarea))
 
             # Click textarea to focus
             self._safe_click(reply_textarea)
-            time.sleep(random.uniform(0.5, 1))
+            self._ensure_focused(reply_textarea)
 
-            # Clear any existing text
+            # Clear any existing text - clear() is synchronous, only focus matters
             reply_textarea.clear()
-            time.sleep(random.uniform(0.3, 0.7))
-
-            """# Type reply with human-like delays
-            logger.info("Typing reply text...")
-            for i, char in enumerate(reply_text):
-                reply_textarea.send_keys(char)
-
-                # Variable delays - faster for common letters, slower for punctuation
-                if char in ' .,!?':
-                    delay = random.uniform(0.1, 0.3)
-                else:
-                    delay = random.uniform(0.05, 0.15)
-
-                time.sleep(delay)
-
-                # Occasional longer pauses to simulate thinking
-                if i > 0 and i % random.randint(15, 25) == 0:
-                    time.sleep(random.uniform(0.5, 1.2))"""
-
-            logger.info("Setting reply text via clipboard injection...")
-            driver.execute_script("""
-                const text = arguments[1];
-                const dataTransfer = new DataTransfer();
-                dataTransfer.setData('text', text);
-                const event = new ClipboardEvent('paste', { clipboardData: dataTransfer, bubbles: true });
-                arguments[0].dispatchEvent(event);
-            """, reply_textarea, reply_text)
+            self._ensure_focused(reply_textarea)
+
+            if self.settings.human_typing:
+                # Stealth mode - one key event and pause per character
+                logger.debug("Typing reply text char by char...")
+                safe_send_keys(reply_textarea, reply_text, clear_first=False)
+            else:
+                # Insert the whole reply as native input in one CDP call - fires the
+                # input events the React editor listens for, unlike setting .value
+                logger.debug("Inserting reply text via CDP...")
+                try:
+                    fast_send_keys(driver, reply_textarea, reply_text)
+                    WebDriverWait(driver, 1, poll_frequency=0.1).until(lambda d: reply_textarea.text.strip())
+                except (WebDriverException, TimeoutException) as e:
+                    # Last resort - a single send_keys call, unless the inserted text
+                    # has shown up since. Clear the editor first so a late insert
+                    # can't end up in the reply twice
+                    if not reply_textarea.text.strip():
+                        logger.debug(f"CDP insertText was not applied, typing reply text: {e}")
+                        self._ensure_focused(reply_textarea)
+                        reply_textarea.send_keys(Keys.CONTROL, "a")
+                        reply_textarea.send_keys(Keys.DELETE)
+                        reply_textarea.send_keys(reply_text)
 
             # Wait before submitting
             time.sleep(random.uniform(1, 2))
 
             # Find and click reply submit button
-            submit_selectors = [
-                '[data-testid="tweetButtonInline"]',
-                '[data-testid="tweetButton"]',
-                'div[role="button"][data-testid*="tweet"]'
-            ]
-
-            reply_submit = None
-            for selector in submit_selectors:
-                try:
-                    reply_submit = wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    break
-                except TimeoutException:
-                    continue
-
-            if not reply_submit:
-                raise Exception("Could not find reply submit button")
-
-            # Submit the reply
-            self._safe_click(reply_submit)
-
-            # Wait for reply to be posted - look for success indicators
-            time.sleep(random.uniform(2, 4))
+            submit_selectors = _SUBMIT_SELECTORS
+            preferred = self._preferred_submit_selector
+            if preferred:
+                submit_selectors = (preferred,) + tuple(sel for sel in submit_selectors if sel != preferred)
+
+            # Watch for success indicators before submitting so none are missed
+            driver.execute_script(_WATCH_SUCCESS_JS, list(_SUCCESS_SELECTORS))
+
+            # Resolve and click the first enabled submit button in one CDP call per poll
+            self._preferred_submit_selector = fast_wait.until(
+                lambda d: self._cdp_click_first(submit_selectors),
+                message="Could not find reply submit button"
+            )
 
-            # Try to detect successful posting
+            # Wait for reply to be posted - resolves as soon as a success indicator is inserted
             try:
-                # Look for success indicators
-                success_indicators = [
-                    '[data-testid="toast"]',  # Success toast
-                    '[role="alert"]',         # Success alert
-                ]
-
-                for indicator in success_indicators:
-                    elements = driver.find_elements(By.CSS_SELECTOR, indicator)
-                    if elements:
-                        logger.info("Reply posting success indicator found")
-                        break
-            except:
+                if driver.execute_async_script(_AWAIT_SUCCESS_JS, 4000):
+                    logger.debug("Reply posting success indicator found")
+            except WebDriverException:
                 pass  # Success detection is optional
 
-            logger.info(f"Successfully replied to @{tweet_data['username']}")
+            logger.info("Successfully replied to @{}", tweet_data['username'])
             return True
 
         except TimeoutException as e:
@@ -932,10 +1673,40 @@ class SeleniumManager:
             logger.error(f"Failed to reply to tweet: {e}")
             return False
 
+    def is_driver_alive(self) -> bool:
+        """Check that the browser session still responds to commands"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
     def close(self):
         """Close the WebDriver safely"""
         logger.info("Closing WebDriver...")
         self._cleanup_driver()
+        self._dump_profile()
+
+    def _dump_profile(self):
+        """Write collected profile stats to disk and log the top cumulative entries"""
+        profiler = self._profiler
+        if not profiler:
+            return
+
+        self._profiler = None
+        profiler.disable()
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(15)
+        logger.info(f"Top calls by cumulative time:\n{summary.getvalue()}")
+
+        try:
+            profiler.dump_stats(_PROFILE_STATS_FILE)
+            logger.info(f"Profile stats written to {_PROFILE_STATS_FILE} (view with: python -m pstats {_PROFILE_STATS_FILE})")
+        except OSError as e:
+            logger.warning(f"Could not write profile stats: {e}")
 
     def __enter__(self):
         """Context manager entry"""
@@ -1,43 +1,236 @@
+import os
 import time
+import heapq
 import random
+import sqlite3
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from functools import cached_property
+from itertools import chain, islice
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, MutableSet, Optional, Tuple
 from loguru import logger
-from selenium.webdriver.common.by import By
 from config.settings import Settings
 from config.credentials import CredentialsManager
 from bot.selenium_manager import SeleniumManager
+from bot.driver_pool import SeleniumManagerPool
 from bot.reply_generator import ReplyGenerator
-from utils.helpers import random_delay
+from utils.helpers import human_delay, tweet_key, load_id_set, save_id_set
+from utils.dedup import BoundedSet, ScalableBloomFilter
+from utils.rate_limit import SlidingWindow
+from utils.action_log import ActionLog
 
 
+def _seconds_until_midnight() -> float:
+    """Seconds until the next local day starts"""
+    now = datetime.now()
+    return (datetime.combine(now.date() + timedelta(days=1), datetime.min.time()) - now).total_seconds()
+
+
+# Replied tweet ids kept for dedup - only recent tweets realistically show up again
+REPLIED_TWEETS_CAPACITY = 10_000
+# Tweets seen during one homepage pass - get_tweets only returns the rendered window,
+# so anything older than this has long scrolled out of reach
+PROCESSED_TWEETS_CAPACITY = 5_000
+
+# Retry delays after a failed action: full jitter over base * 2**streak, capped
+_RETRY_BASE_SECONDS = 30
+_RETRY_MAX_SECONDS = 1800
+_RETRY_MAX_STREAK = 8
+
+# Longest a fetched follower list is reused by the next follow cycle
+_FOLLOWERS_CACHE_TTL = 900
+
+# Upcoming tweets whose replies are generated together in one model request
+_REPLY_BATCH_SIZE = 8
+# Longest a tweet waits on its prefetched reply before generating one itself
+_PREFETCH_WAIT_SECONDS = 60
+
 
 class TwitterBot:
-    def __init__(self, settings: Settings, test_mode: bool = False):
+    def __init__(self, settings: Settings, test_mode: bool = False,
+                 shared_replied: Optional[MutableSet[str]] = None):
         self.settings = settings
         self.test_mode = test_mode
-        self.credentials_manager = CredentialsManager(settings)
         self.selenium_manager: Optional[SeleniumManager] = None
-        self.reply_generator = ReplyGenerator(api_key=settings.twitter_api_key)
 
-        # Tracking variables
+        # Tracking variables - hourly limits are sliding windows (_reply_window, _like_window)
         self.replies_today = 0
-        self.replies_this_hour = 0
-        self.last_hour_reset = datetime.now().hour
-        self.replied_tweets = set()  # Track tweets we've already replied to
-        self._initialized = False
-
         self.follows_today = 0
         self.likes_today = 0
-        self.likes_this_hour = 0
-        self.last_follower_check = datetime.now() - timedelta(hours=2)  # Check immediately on first run
-        self.last_like_check = datetime.now() - timedelta(minutes=30)   # Check immediately on first run
-        self.followed_users = set()  # Track users we've already followed
-        self.liked_posts = set()     # Track posts we've already liked
-
+        # Epoch time the next local day starts; daily counters reset once it passes
+        self._next_day_at = time.time() + _seconds_until_midnight()
+        # Track tweets we've already replied to - persisted per account
+        self.replied_tweets = BoundedSet(REPLIED_TWEETS_CAPACITY)
+        # Tweets other bots in this run replied to (see orchestrator.py); never persisted
+        self._shared_replied = shared_replied
+        self._initialized = False
+        self._state_loaded = False
+        self._fail_streak = 0  # consecutive failed actions, drives the retry backoff
+
+        # time.monotonic() deadlines for the next follow-back and like checks
+        self._next_follower_check = time.monotonic()  # Check immediately on first run
+        self._next_like_check = time.monotonic()      # Check immediately on first run
+        # (monotonic expiry, usernames) from the last follower fetch
+        self._followers_cache: Optional[tuple] = None
+        # Users/posts already acted on - a rare false positive only skips one action
+        self.followed_users = ScalableBloomFilter()
+        self.liked_posts = ScalableBloomFilter()
+
+        # Set by stop(); every idle wait in run() returns as soon as it is set
+        self._stop_event = threading.Event()
+        # Min-heap of (when, action) - run() sleeps until the earliest entry
+        self._wakeups: List[tuple] = []
+        # Follow/like cycles running on side browsers, by kind
+        self._side_tasks: Dict[str, Future] = {}
 
         logger.info(f"TwitterBot initialized {'(TEST MODE)' if test_mode else ''}")
 
+    @cached_property
+    def credentials_manager(self) -> CredentialsManager:
+        """Created on first login, so bots that never log in don't pay for it"""
+        return CredentialsManager(self.settings)
+
+    @cached_property
+    def reply_generator(self) -> ReplyGenerator:
+        """Created on first reply, so bots that never reply don't build an API client"""
+        return ReplyGenerator(api_key=self.settings.twitter_api_key)
+
+    @cached_property
+    def _side_pool(self) -> Optional[SeleniumManagerPool]:
+        """Extra browsers for follow/like cycles, so they don't navigate the reply browser away"""
+        size = self.settings.driver_pool_size
+        if size <= 1:
+            return None
+        if not self.settings.allow_parallel:
+            logger.warning("DRIVER_POOL_SIZE > 1 needs ALLOW_PARALLEL=true; using a single browser")
+            return None
+        # Side browsers run on throwaway profile copies - give them the credentials to log in
+        return SeleniumManagerPool(self.settings, size=size - 1,
+                                   credentials=self.credentials_manager.get_twitter_credentials())
+
+    @cached_property
+    def _side_executor(self) -> ThreadPoolExecutor:
+        """Threads that run follow/like cycles on side browsers alongside the reply cycle"""
+        return ThreadPoolExecutor(max_workers=self._side_pool.size, thread_name_prefix="side-cycle")
+
+    def _run_cycle(self, kind: str, cycle):
+        """Run a follow/like cycle - in the background if it has its own browser"""
+        if self._side_pool is None:
+            cycle()
+            return
+
+        running = self._side_tasks.get(kind)
+        if running is not None and not running.done():
+            logger.info(f"Previous {kind} cycle still running, skipping this one")
+            return
+        self._side_tasks[kind] = self._side_executor.submit(cycle)
+
+    @contextmanager
+    def _cycle_manager(self):
+        """SeleniumManager for a follow/like cycle - pooled if available, else the main one"""
+        pool = self._side_pool
+        if pool is None:
+            yield self.selenium_manager
+            return
+        with pool.acquire() as manager:
+            yield manager
+
+    @cached_property
+    def _reply_window(self) -> SlidingWindow:
+        """Hourly reply allowance - no more than the limit in any trailing hour"""
+        return SlidingWindow(self.settings.max_replies_per_hour, 3600)
+
+    @cached_property
+    def _like_window(self) -> SlidingWindow:
+        """Hourly like allowance - no more than the limit in any trailing hour"""
+        return SlidingWindow(self.settings.max_likes_per_hour, 3600)
+
+    @cached_property
+    def _action_log(self) -> ActionLog:
+        """Per-action journal that survives crashes between state snapshots"""
+        return ActionLog(self._state_path('actions.db'))
+
+    def _record(self, kind: str, item_id: str):
+        """Journal a completed action; dedup still works in memory if this fails"""
+        try:
+            self._action_log.add(kind, item_id)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to record {kind} {item_id}: {e}")
+
+    def _replay_action_log(self):
+        """Add actions journaled since the last snapshot to the in-memory dedup state"""
+        try:
+            log = self._action_log
+            # Oldest first, so the bounded set evicts the oldest of them if it fills up
+            for tweet_id in log.ids('reply'):
+                self.replied_tweets.add(tweet_id)
+            for username in log.ids('follow'):
+                self.followed_users.add(username)
+            for post_id in log.ids('like'):
+                self.liked_posts.add(post_id)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read action log: {e}")
+
+    @cached_property
+    def _reply_keywords(self) -> Tuple[str, ...]:
+        """Reply keywords parsed once - settings don't change while the bot runs"""
+        return self.settings.reply_keywords_list
+
+    @cached_property
+    def _max_replies_per_day(self) -> int:
+        """Daily reply limit - checked before every tweet, so read from settings once"""
+        return self.settings.max_replies_per_day
+
+    @cached_property
+    def _reply_executor(self) -> ThreadPoolExecutor:
+        """Single worker that generates the next reply while the bot waits between replies"""
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="reply-gen")
+
+    def _upcoming(self, tweets: List[Dict], keys: List[str], start: int, processed_tweets: MutableSet[str]):
+        """(tweet_id, text) for the tweets from start on that will actually be processed"""
+        for tweet, tweet_id in zip(islice(tweets, start, None), islice(keys, start, None)):
+            if tweet_id in processed_tweets or self._already_replied(tweet_id):
+                continue
+            yield tweet_id, tweet.get('text', '')
+
+    def _prefetch_replies(self, candidates) -> Dict[str, Future]:
+        """Start generating replies for up to _REPLY_BATCH_SIZE candidate tweets
+
+        candidates yields (tweet_id, text). Returns a future per tweet id; all
+        of them are filled by one batched model request, run in the background
+        so its latency hides behind the anti-detection delay.
+        """
+        # The same tweet can show up twice on a timeline - one future per id
+        batch: Dict[str, str] = {}
+        for tweet_id, text in candidates:
+            batch.setdefault(tweet_id, text)
+            if len(batch) >= _REPLY_BATCH_SIZE:
+                break
+        futures = {tweet_id: Future() for tweet_id in batch}
+        if not batch:
+            return futures
+
+        def generate():
+            replies = []
+            error: Exception = RuntimeError("Reply prefetch failed")
+            try:
+                replies = self.reply_generator.generate_replies(list(batch.values()), self._reply_keywords)
+            except Exception as e:
+                logger.error(f"Failed to prefetch replies: {e}")
+                error = e
+            finally:
+                # Resolve every future, so no tweet is left waiting on one
+                for index, future in enumerate(futures.values()):
+                    if index < len(replies):
+                        future.set_result(replies[index])
+                    else:
+                        future.set_exception(error)
+
+        self._reply_executor.submit(generate)
+        return futures
+
     def _validate_driver(self) -> bool:
         """Validate that the WebDriver is available and working"""
         try:
@@ -50,7 +243,9 @@ class TwitterBot:
                 return False
 
             # Test if driver is still responsive
-            self.selenium_manager.driver.current_url
+            if not self.selenium_manager.is_driver_alive():
+                logger.error("WebDriver session is not responding")
+                return False
             return True
 
         except Exception as e:
@@ -65,62 +260,121 @@ class TwitterBot:
                 logger.error("Failed to initialize bot")
                 return
 
-            # Main loop
-            while True:
-                try:
-                    self._check_hourly_reset()
-                    self._reset_daily_counters_if_needed()
-
-                    # Execute reply cycle if within limits
-                    if self._should_continue_today():
-                        self._execute_reply_cycle()
-                    else:
-                        logger.info("Daily reply limit reached. Skipping reply cycle...")
-
-                    # Execute auto-follow cycle if enabled and time has come
-                    if self._should_check_followers():
-                        self._execute_auto_follow_cycle()
-                        self.last_follower_check = datetime.now()
-
-                    # Execute auto-like cycle if enabled and time has come
-                    if self._should_like_following_posts():
-                        self._execute_auto_like_cycle()
-                        self.last_like_check = datetime.now()
-
-                    # Wait before next iteration
-                    if not any([
-                        self._should_continue_today(),
-                        self._should_check_followers(),
-                        self._should_like_following_posts()
-                    ]):
-                        logger.info("All limits reached or intervals not met. Waiting...")
-                        time.sleep(1800)  # Wait 30 minutes before checking again
-                    else:
-                        # Short wait between cycles
-                        time.sleep(60)  # 1 minute between checks
+            # Main loop - sleep until the earliest scheduled action, run it, reschedule it
+            self._seed_wakeups()
+            while not self._stop_event.is_set():
+                when, kind = heapq.heappop(self._wakeups)
+                delay = when - time.monotonic()
+                if delay > 0 and self._stop_event.wait(delay):
+                    break
 
+                try:
+                    next_time = self._dispatch(kind)
+                    self._fail_streak = 0
                 except KeyboardInterrupt:
                     logger.info("Bot stopped by user")
                     break
                 except Exception as e:
-                    logger.error(f"Error in main loop: {e}")
-                    # Wait before retrying
-                    time.sleep(300)  # 5 minutes
+                    # _dispatch re-initializes the session before the retry
+                    delay = self._retry_delay()
+                    logger.error(f"Error in main loop: {e} - retrying {kind} in {delay:.0f} seconds")
+                    next_time = time.monotonic() + delay
+
+                if next_time is not None:
+                    heapq.heappush(self._wakeups, (next_time, kind))
 
         finally:
             self._cleanup()
 
+    def _retry_delay(self) -> float:
+        """Exponential backoff with full jitter, growing with consecutive failures"""
+        self._fail_streak = min(self._fail_streak + 1, _RETRY_MAX_STREAK)
+        return random.uniform(0, min(_RETRY_MAX_SECONDS, _RETRY_BASE_SECONDS * 2 ** self._fail_streak))
+
+    def stop(self):
+        """Ask run() to exit at its next wait; safe to call from signal handlers"""
+        self._stop_event.set()
+
+    def _seed_wakeups(self):
+        """Schedule the first run of every action"""
+        now = time.monotonic()
+        self._wakeups = [
+            (now, 'reply'),
+            (now + _seconds_until_midnight(), 'day'),
+        ]
+        if self.settings.enable_auto_follow_back:
+            self._wakeups.append((self._next_follower_check, 'follow'))
+        if self.settings.enable_auto_like_following:
+            self._wakeups.append((self._next_like_check, 'like'))
+        heapq.heapify(self._wakeups)
+
+    def _dispatch(self, kind: str) -> Optional[float]:
+        """Run one scheduled action and return its next time.monotonic() deadline"""
+        if kind == 'day':
+            self._reset_daily_counters_if_needed()
+            return time.monotonic() + _seconds_until_midnight()
+
+        # Recover a dead or logged-out session before any browser work; raising
+        # makes run() back off and retry instead of idling with no browser
+        if not self._initialize():
+            raise RuntimeError("Browser session is not initialized")
+
+        if kind == 'follow':
+            self._run_cycle(kind, self._execute_auto_follow_cycle)
+            self._next_follower_check = time.monotonic() + self.settings.check_followers_interval
+            return self._next_follower_check
+
+        if kind == 'like':
+            self._run_cycle(kind, self._execute_auto_like_cycle)
+            self._next_like_check = time.monotonic() + self.settings.like_following_posts_interval
+            return self._next_like_check
+
+        # Reply cycle - when a limit is hit, sleep until it allows another reply
+        # (plus a second, so the daily reset handler always runs first)
+        if not self._should_continue_today():
+            logger.info("Daily reply limit reached. Waiting until midnight...")
+            return time.monotonic() + _seconds_until_midnight() + 1
+        if self._should_stop_replying():
+            wait = self._reply_window.time_until() + 1
+            logger.info(f"Hourly reply limit reached. Waiting {wait:.0f} seconds...")
+            return time.monotonic() + wait
+
+        self._execute_reply_cycle()
+        return time.monotonic() + 60  # 1 minute between cycles
+
     def _initialize(self) -> bool:
         """Initialize the bot - setup driver and login"""
         try:
-            # Initialize SeleniumManager
-            self.selenium_manager = SeleniumManager(self.settings)
+            if not self._state_loaded:
+                # Restore tweets replied to in previous runs
+                # Saved least recent first - adding in order keeps the eviction order
+                for tweet_id in load_id_set(self.settings.replied_tweets_file):
+                    self.replied_tweets.add(tweet_id)
+                logger.info(f"Loaded {len(self.replied_tweets)} previously replied tweets")
+                self.followed_users = ScalableBloomFilter.fromfile(self._state_path('followed_users.bloom'))
+                self.liked_posts = ScalableBloomFilter.fromfile(self._state_path('liked_posts.bloom'))
+                self._replay_action_log()
+                self._state_loaded = True
+
+            if self.selenium_manager is not None and self.selenium_manager.is_driver_alive():
+                # Re-initializing a live, recently logged-in session is a no-op;
+                # once that goes stale, re-check the login on the same browser
+                if self._initialized and self.selenium_manager.login_is_fresh:
+                    return True
+                self._initialized = False
+            else:
+                # Replace a session that died
+                self._initialized = False
+                self._discard_selenium_manager()
 
-            # Setup WebDriver
-            if not self.selenium_manager.setup_driver():
-                logger.error("Failed to setup WebDriver")
-                self.selenium_manager = None
-                return False
+                # Initialize SeleniumManager
+                self.selenium_manager = SeleniumManager(self.settings)
+
+                # Setup WebDriver
+                if not self.selenium_manager.setup_driver():
+                    logger.error("Failed to setup WebDriver")
+                    self._discard_selenium_manager()
+                    return False
 
             # Navigate to Twitter to check login status
             logger.info("Checking login status...")
@@ -157,9 +411,20 @@ class TwitterBot:
 
         except Exception as e:
             logger.error(f"Initialization failed: {e}")
-            self.selenium_manager = None
+            # Close it first - a leaked Chrome keeps the profile locked for every retry
+            self._discard_selenium_manager()
             return False
 
+    def _discard_selenium_manager(self):
+        """Close and drop the main SeleniumManager, releasing its browser profile"""
+        manager, self.selenium_manager = self.selenium_manager, None
+        if manager is None:
+            return
+        try:
+            manager.close()
+        except Exception as e:
+            logger.warning(f"Error closing SeleniumManager: {e}")
+
     def _execute_auto_follow_cycle(self):
         """Execute auto-follow back cycle"""
         if not self.settings.enable_auto_follow_back:
@@ -168,31 +433,48 @@ class TwitterBot:
         if not self._initialized or not self.selenium_manager:
             return
 
+        # The follower list changes slowly - if everyone on a recent fetch has
+        # been followed back, skip loading the page again. Otherwise refetch,
+        # since the follow buttons from the last fetch are stale element handles
+        now = time.monotonic()
+        cached = self._followers_cache
+        if cached and cached[0] > now and all(name in self.followed_users for name in cached[1]):
+            logger.info("All recently fetched followers already followed back")
+            return
+
         try:
             logger.info("Starting auto-follow back cycle...")
 
-            # Get followers who aren't being followed back
-            followers = self.selenium_manager.get_followers(limit=30)
-
-            followed_count = 0
-            for follower in followers:
-                if self.follows_today >= self.settings.max_follows_per_day:
-                    logger.info("Daily follow limit reached")
-                    break
-
-                username = follower['username']
-                if username in self.followed_users:
-                    continue
+            with self._cycle_manager() as selenium_manager:
+                # Get followers who aren't being followed back
+                followers = selenium_manager.get_followers(limit=30)
+                if followers:
+                    ttl = min(self.settings.check_followers_interval, _FOLLOWERS_CACHE_TTL)
+                    self._followers_cache = (now + ttl, frozenset(f['username'] for f in followers))
+
+                followed_count = 0
+                followed_users = self.followed_users
+                max_follows_per_day = self.settings.max_follows_per_day
+                for follower in followers:
+                    if self.follows_today >= max_follows_per_day:
+                        logger.info("Daily follow limit reached")
+                        break
+
+                    username = follower['username']
+                    if username in followed_users:
+                        continue
 
-                if self.selenium_manager.follow_user(follower):
-                    self.follows_today += 1
-                    self.followed_users.add(username)
-                    followed_count += 1
+                    if selenium_manager.follow_user(follower):
+                        self.follows_today += 1
+                        followed_users.add(username)
+                        self._record('follow', username)
+                        followed_count += 1
 
-                    # Random delay between follows
-                    delay = random.randint(30, 60)  # 30-60 seconds between follows
-                    logger.info(f"Waiting {delay} seconds before next follow...")
-                    time.sleep(delay)
+                        # Random delay between follows
+                        delay = human_delay(30, 60)  # 30-60 seconds between follows
+                        logger.info("Waiting {:.0f} seconds before next follow...", delay)
+                        if self._stop_event.wait(delay):
+                            break
 
             logger.info(f"Auto-follow cycle completed. Followed {followed_count} users back.")
 
@@ -210,71 +492,62 @@ class TwitterBot:
         try:
             logger.info("Starting auto-like following posts cycle...")
 
-            # Get recent posts from following
-            posts = self.selenium_manager.get_following_posts(limit=25)
-
-            liked_count = 0
-            for post in posts:
-                if (self.likes_today >= self.settings.max_likes_per_day or
-                    self.likes_this_hour >= self.settings.max_likes_per_hour):
-                    logger.info("Like limit reached")
-                    break
-
-                # Create unique identifier for post
-                post_id = f"{post['username']}:{hash(post['tweet_text'])}"
-                if post_id in self.liked_posts:
-                    continue
+            with self._cycle_manager() as selenium_manager:
+                # Get recent posts from following
+                posts = selenium_manager.get_following_posts(limit=25)
+
+                liked_count = 0
+                liked_posts = self.liked_posts
+                max_likes_per_day = self.settings.max_likes_per_day
+                like_window = self._like_window
+                for post in posts:
+                    post_id = tweet_key(post.get('username', ''), post.get('tweet_text', ''))
+                    if self.likes_today >= max_likes_per_day or not like_window.has_tokens():
+                        logger.info("Like limit reached")
+                        break
+
+                    if post_id in liked_posts:
+                        continue
 
-                if self.selenium_manager.like_post(post):
-                    self.likes_today += 1
-                    self.likes_this_hour += 1
-                    self.liked_posts.add(post_id)
-                    liked_count += 1
+                    if selenium_manager.like_post(post):
+                        self.likes_today += 1
+                        like_window.consume()
+                        liked_posts.add(post_id)
+                        self._record('like', post_id)
+                        liked_count += 1
 
-                    # Random delay between likes
-                    delay = random.randint(5, 15)  # 5-15 seconds between likes
-                    logger.info(f"Waiting {delay} seconds before next like...")
-                    time.sleep(delay)
+                        # Random delay between likes
+                        delay = human_delay(5, 15)  # 5-15 seconds between likes
+                        logger.info("Waiting {:.0f} seconds before next like...", delay)
+                        if self._stop_event.wait(delay):
+                            break
 
             logger.info(f"Auto-like cycle completed. Liked {liked_count} posts.")
 
         except Exception as e:
             logger.error(f"Error in auto-like cycle: {e}")
 
-    def _should_check_followers(self) -> bool:
-        """Check if it's time to run follower check"""
-        return (datetime.now() - self.last_follower_check).seconds >= self.settings.check_followers_interval
-
-    def _should_like_following_posts(self) -> bool:
-        """Check if it's time to like following posts"""
-        return (datetime.now() - self.last_like_check).seconds >= self.settings.like_following_posts_interval
-
     def _reset_daily_counters_if_needed(self):
         """Reset daily counters at midnight"""
-        now = datetime.now()
-        if now.date() != getattr(self, '_last_date', now.date()):
+        if time.time() >= self._next_day_at:
             self.replies_today = 0
             self.follows_today = 0
             self.likes_today = 0
-            self._last_date = now.date()
+            # Recomputed rather than += 86400 so DST changes don't shift the boundary
+            self._next_day_at = time.time() + _seconds_until_midnight()
             logger.info("Daily counters reset")
 
-    # Modify the _check_hourly_reset method to also reset likes counter:
-    def _check_hourly_reset(self):
-        """Reset hourly counter if hour has changed"""
-        current_hour = datetime.now().hour
-        if current_hour != self.last_hour_reset:
-            self.replies_this_hour = 0
-            self.likes_this_hour = 0  # Add this line
-            self.last_hour_reset = current_hour
-            logger.info("Hourly reply and like counters reset")
-
     def _execute_reply_cycle(self):
         """Execute one cycle of finding and replying to tweets"""
         if not self._initialized or not self.selenium_manager:
             logger.error("Bot not properly initialized")
             return
 
+        # Nothing to do until the hourly/daily limit resets - skip the search and scroll
+        if self._should_stop_replying():
+            logger.info("Reply limit reached. Skipping reply cycle...")
+            return
+
         try:
             # Search for tweets
             if not self.selenium_manager.search_tweets(self.settings.default_search_query):
@@ -296,7 +569,7 @@ class TwitterBot:
                 if self._process_tweet(tweet):
                     replied_count += 1
                     self.replies_today += 1
-                    self.replies_this_hour += 1
+                    self._reply_window.consume()
 
                     # Random delay between replies
                     delay = random.randint(
@@ -310,11 +583,8 @@ class TwitterBot:
             replied_count = self._process_all_tweets_in_homepage()
 
             logger.info(f"Reply cycle completed. Replied to {replied_count} tweets.")
-
-            # Longer delay between cycles
-            cycle_delay = random.randint(30, 60)  # 1 minutes
-            logger.info(f"Cycle complete. Waiting {cycle_delay} seconds before next cycle...")
-            time.sleep(cycle_delay)
+            # The gap before the next cycle is scheduled by run(), which can
+            # fit follow/like cycles into it instead of sleeping here as well
 
         except Exception as e:
             logger.error(f"Error in reply cycle: {e}")
@@ -326,9 +596,17 @@ class TwitterBot:
             return 0
 
         replied_count = 0
-        processed_tweets = set()  # Track tweets in this session to avoid duplicates
+        processed_tweets = BoundedSet(PROCESSED_TWEETS_CAPACITY)  # Track tweets in this session to avoid duplicates
         consecutive_no_new_tweets = 0
         max_consecutive_no_new_tweets = 3  # Stop after 3 consecutive scrolls with no new tweets
+        prefetched = {}  # tweet_id -> future for replies generated during the last delay
+        next_reply_at = 0.0  # monotonic time the anti-detection delay ends
+
+        # Settings read for every tweet below
+        reply_window = self._reply_window
+        max_replies_per_day = self._max_replies_per_day
+        min_delay = self.settings.min_delay_seconds
+        max_delay = self.settings.max_delay_seconds
 
         try:
             logger.info("Starting to process all tweets in homepage...")
@@ -362,61 +640,73 @@ class TwitterBot:
 
                 # Process new tweets
                 new_tweets_found = 0
-                for tweet in tweets:
-                    tweet_text = tweet.get('text', '')
-                    username = tweet.get('username', '')
-                    tweet_id = f"{username}:{hash(tweet_text)}"
-
+                keys = [tweet_key(tweet.get('username', ''), tweet.get('text', '')) for tweet in tweets]
+                for index, (tweet, tweet_id) in enumerate(zip(tweets, keys)):
                     # Skip if we've already processed this tweet in this session
                     if tweet_id in processed_tweets:
                         continue
 
                     processed_tweets.add(tweet_id)
                     new_tweets_found += 1
+                    # Reply prefetched for this tweet, if there is one
+                    pending_reply = prefetched.pop(tweet_id, None)
 
                     # Check if we should stop due to hourly limits
-                    if self.replies_this_hour >= self.settings.max_replies_per_hour:
-                        logger.info("Hourly reply limit reached. Continuing to scroll but not replying until next hour.")
+                    if not reply_window.has_tokens():
+                        logger.info("Hourly reply limit reached. Continuing to scroll but not replying for now.")
                         continue
 
-                    # Process the tweet
-                    if self._process_tweet(tweet):
+                    # Wait out whatever is left of the delay - scrolling and fetching
+                    # since the last reply already used part of it
+                    remaining = next_reply_at - time.monotonic()
+                    if remaining > 0:
+                        if pending_reply is None and not self._already_replied(tweet_id):
+                            prefetched = self._prefetch_replies(chain(
+                                [(tweet_id, tweet.get('text', ''))],
+                                self._upcoming(tweets, keys, index + 1, processed_tweets)
+                            ))
+                            pending_reply = prefetched.pop(tweet_id)
+                        if self._stop_event.wait(remaining):
+                            return replied_count
+
+                    if self._process_tweet(tweet, tweet_id, pending_reply):
                         replied_count += 1
                         self.replies_today += 1
-                        self.replies_this_hour += 1
+                        reply_window.consume()
 
-                        logger.info(f"Progress: {replied_count} replies sent, {self.replies_today}/{self.settings.max_replies_per_day} daily limit")
+                        logger.info("Progress: {} replies sent, {}/{} daily limit", replied_count, self.replies_today, max_replies_per_day)
 
-                        # Random delay between replies
-                        delay = random.randint(
-                            self.settings.min_delay_seconds,
-                            self.settings.max_delay_seconds
-                        )
-                        logger.info(f"Waiting {delay} seconds before next action...")
-                        time.sleep(delay)
+                        # Generate the next replies while we wait
+                        if not prefetched and not self._should_stop_replying():
+                            prefetched = self._prefetch_replies(self._upcoming(tweets, keys, index + 1, processed_tweets))
+
+                        # Random delay between replies - the next batch is scrolled
+                        # and fetched meanwhile, so only the rest is spent waiting
+                        delay = human_delay(min_delay, max_delay)
+                        next_reply_at = time.monotonic() + delay
+                        logger.info("Next reply in {:.0f} seconds", delay)
 
                 # Check if we found new tweets
                 if new_tweets_found == 0:
                     consecutive_no_new_tweets += 1
-                    logger.info(f"No new tweets found. Consecutive count: {consecutive_no_new_tweets}")
+                    logger.info("No new tweets found. Consecutive count: {}", consecutive_no_new_tweets)
                 else:
                     consecutive_no_new_tweets = 0
-                    logger.info(f"Found {new_tweets_found} new tweets to process")
+                    logger.info("Found {} new tweets to process", new_tweets_found)
 
                 # Stop if we haven't found new tweets for several scrolls
                 if consecutive_no_new_tweets >= max_consecutive_no_new_tweets:
                     logger.info("Reached end of available tweets. No new tweets found after multiple scrolls.")
                     break
 
-                # Scroll down to load more tweets
+                # Scroll down and wait for new content to load, probing the result in the same call
                 logger.info("Scrolling down to load more tweets...")
-                self.selenium_manager.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-                # Wait for new content to load
-                time.sleep(random.uniform(3, 5))
+                probe = self.selenium_manager.scroll_timeline(random.uniform(3, 5))
+                if self._stop_event.is_set():
+                    return replied_count
 
                 # Check if page height changed (new content loaded)
-                new_height = self.selenium_manager.driver.execute_script("return document.body.scrollHeight")
+                new_height = probe['height']
                 if new_height == last_height:
                     logger.info("Page height didn't change - might have reached the end")
                     consecutive_no_new_tweets += 1
@@ -425,7 +715,7 @@ class TwitterBot:
                     consecutive_no_new_tweets = 0  # Reset counter if page grew
 
                 # Additional check for "end of timeline" indicators
-                if self._check_end_of_timeline():
+                if probe['at_end']:
                     logger.info("Detected end of timeline indicator")
                     break
 
@@ -435,43 +725,12 @@ class TwitterBot:
         logger.info(f"Finished processing homepage. Total replies sent: {replied_count}")
         return replied_count
 
-    def _check_end_of_timeline(self) -> bool:
-        """Check for indicators that we've reached the end of the timeline"""
-        if not self.selenium_manager or not self.selenium_manager.driver:
-            return False
-
-        try:
-            # Common end-of-timeline indicators
-            end_indicators = [
-                "You're all caught up",
-                "Nothing more to load",
-                "End of timeline",
-                "No more tweets",
-                '[data-testid="emptyState"]',
-                '.css-1dbjc4n.r-1loqt21.r-1otgn73.r-1i6wzkk.r-lrvibr'  # Twitter's empty state class
-            ]
-
-            page_source = self.selenium_manager.driver.page_source.lower()
-
-            # Check for text indicators
-            for indicator in end_indicators[:4]:  # Text indicators
-                if indicator.lower() in page_source:
-                    return True
-
-            # Check for element indicators
-            for selector in end_indicators[4:]:  # CSS selectors
-                elements = self.selenium_manager.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and any(el.is_displayed() for el in elements):
-                    return True
-
-            return False
-
-        except Exception as e:
-            logger.debug(f"Error checking end of timeline: {e}")
-            return False
+    def _process_tweet(self, tweet_data: Dict, tweet_id: str, pending_reply: Optional[Future] = None) -> bool:
+        """Process a single tweet - decide if we should reply and do it
 
-    def _process_tweet(self, tweet_data: Dict) -> bool:
-        """Process a single tweet - decide if we should reply and do it"""
+        tweet_id is the tweet's dedup key; pending_reply is an already-started
+        generate_reply call for this tweet.
+        """
         if not self.selenium_manager:
             logger.error("SeleniumManager not available")
             return False
@@ -480,11 +739,12 @@ class TwitterBot:
             tweet_text = tweet_data.get('text', '')
             username = tweet_data.get('username', '')
 
-            # Create unique identifier for this tweet
-            tweet_id = f"{username}:{hash(tweet_text)}"
-
             # Skip if we've already replied to this tweet
-            if tweet_id in self.replied_tweets:
+            if self._already_replied(tweet_id):
+                return False
+
+            # Don't generate a reply we're not allowed to send
+            if self._should_stop_replying():
                 return False
 
             """# Check if we should reply
@@ -494,11 +754,18 @@ class TwitterBot:
             ):
                 return False"""
 
-            # Generate reply
-            reply_text = self.reply_generator.generate_reply(
-                tweet_text,
-                self.settings.reply_keywords_list
-            )
+            # Generate reply - inline if the prefetch failed or is taking too long
+            if pending_reply is not None:
+                try:
+                    reply_text = pending_reply.result(timeout=_PREFETCH_WAIT_SECONDS)
+                except Exception as e:
+                    logger.warning(f"Prefetched reply unavailable, generating it now: {e}")
+                    pending_reply = None
+            if pending_reply is None:
+                reply_text = self.reply_generator.generate_reply(
+                    tweet_text,
+                    self._reply_keywords
+                )
 
             if not reply_text:
                 logger.warning("Failed to generate reply")
@@ -507,13 +774,14 @@ class TwitterBot:
             # In test mode, just log what we would do
             if self.test_mode:
                 logger.info(f"TEST MODE - Would reply to @{username}: {reply_text}")
-                self.replied_tweets.add(tweet_id)
+                self._mark_replied(tweet_id)
                 return True
 
             # Actually reply
             if self.selenium_manager.reply_to_tweet(tweet_data, reply_text):
-                logger.info(f"Successfully replied to @{username}")
-                self.replied_tweets.add(tweet_id)
+                logger.info("Successfully replied to @{}", username)
+                self._mark_replied(tweet_id)
+                self._record('reply', tweet_id)
                 return True
             else:
                 logger.warning(f"Failed to reply to @{username}")
@@ -523,15 +791,27 @@ class TwitterBot:
             logger.error(f"Error processing tweet: {e}")
             return False
 
+    def _already_replied(self, tweet_id: str) -> bool:
+        """Whether this bot, or another one sharing the run, replied to the tweet"""
+        shared = self._shared_replied
+        return tweet_id in self.replied_tweets or (shared is not None and tweet_id in shared)
+
+    def _mark_replied(self, tweet_id: str):
+        self.replied_tweets.add(tweet_id)
+        if self._shared_replied is not None:
+            self._shared_replied.add(tweet_id)
+
     def _should_continue_today(self) -> bool:
         """Check if we should continue replying today"""
-        return self.replies_today < self.settings.max_replies_per_day
+        # Long homepage passes can run past midnight - roll the day over here too
+        self._reset_daily_counters_if_needed()
+        return self.replies_today < self._max_replies_per_day
 
     def _should_stop_replying(self) -> bool:
         """Check if we should stop replying in this cycle"""
         return (
-            self.replies_this_hour >= self.settings.max_replies_per_hour or
-            self.replies_today >= self.settings.max_replies_per_day
+            not self._reply_window.has_tokens() or
+            self.replies_today >= self._max_replies_per_day
         )
 
     ''' def _check_hourly_reset(self):
@@ -544,8 +824,66 @@ class TwitterBot:
 
 '''
 
+    def _state_path(self, name: str) -> str:
+        """Path of a dedup state file inside the configured state directory"""
+        return os.path.join(self.settings.state_dir, name)
+
+    def _save_state(self):
+        """Persist dedup state so restarts don't reply, follow or like twice
+
+        The action journal is truncated up to the snapshot afterwards, so the
+        next start only replays what happened since.
+        """
+        # Journal entries added after this may be missing from the snapshot - keep those
+        mark = None
+        if self._state_loaded:
+            try:
+                mark = self._action_log.last_seq()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to read action log: {e}")
+
+        try:
+            if self.replied_tweets:
+                save_id_set(self.settings.replied_tweets_file, self.replied_tweets)
+            if len(self.followed_users):
+                self.followed_users.tofile(self._state_path('followed_users.bloom'))
+            if len(self.liked_posts):
+                self.liked_posts.tofile(self._state_path('liked_posts.bloom'))
+        except OSError as e:
+            logger.error(f"Failed to save dedup state: {e}")
+            return
+
+        if mark:
+            try:
+                self._action_log.truncate(mark)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to truncate action log: {e}")
+
     def _cleanup(self):
         """Cleanup resources"""
+        # Drop any reply still being prefetched
+        reply_executor = self.__dict__.pop('_reply_executor', None)
+        if reply_executor is not None:
+            reply_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Background cycles hold side browsers and add to the dedup state -
+        # stop them before closing the pool and snapshotting that state
+        side_executor = self.__dict__.pop('_side_executor', None)
+        if side_executor is not None:
+            self._stop_event.set()
+            side_executor.shutdown(wait=True, cancel_futures=True)
+        self._side_tasks.clear()
+
+        self._save_state()
+
+        side_pool = self.__dict__.pop('_side_pool', None)
+        if side_pool is not None:
+            side_pool.close()
+
+        action_log = self.__dict__.pop('_action_log', None)
+        if action_log is not None:
+            action_log.close()
+
         try:
             if hasattr(self, 'selenium_manager') and self.selenium_manager is not None:
                 self.selenium_manager.close()
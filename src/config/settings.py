@@ -1,11 +1,22 @@
 import os
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 from dotenv import load_dotenv
 from pydantic.v1 import BaseSettings, Field
 
 # Load environment variables
 load_dotenv()
 
+
+@lru_cache(maxsize=8)
+def _split_keywords(raw: str) -> Tuple[str, ...]:
+    """Comma-separated keywords, split once per distinct string
+
+    A tuple, since every caller shares the cached result.
+    """
+    return tuple(kw.strip() for kw in raw.split(','))
+
+
 class Settings(BaseSettings):
     # Twitter Credentials
     twitter_username: str = Field(..., env="TWITTER_USERNAME")
@@ -36,18 +47,31 @@ class Settings(BaseSettings):
     headless_mode: bool = Field(False, env="HEADLESS_MODE")
     browser_timeout: int = Field(30, env="BROWSER_TIMEOUT")
     page_load_timeout: int = Field(15, env="PAGE_LOAD_TIMEOUT")
+    page_load_strategy: str = Field("eager", env="PAGE_LOAD_STRATEGY")  # normal, eager or none
+    block_media: bool = Field(True, env="BLOCK_MEDIA")  # Skip images, video and fonts
+    profile_dir: str = Field("browser_data", env="PROFILE_DIR")  # Persistent Chrome profile (one per account)
+    allow_parallel: bool = Field(False, env="ALLOW_PARALLEL")  # Per-instance browser profiles
+    proxy_server: str = Field("", env="PROXY_SERVER")  # e.g. http://host:port
+    persist_session: bool = Field(False, env="PERSIST_SESSION")  # Leave Chrome running and re-attach on restart
+    driver_pool_size: int = Field(1, env="DRIVER_POOL_SIZE")  # Browsers per bot; >1 needs allow_parallel
+    human_typing: bool = Field(False, env="HUMAN_TYPING")  # Type replies char by char (slow, stealthier)
 
     # Logging
     log_level: str = Field("INFO", env="LOG_LEVEL")
     log_file: str = Field("logs/twitter_bot.log", env="LOG_FILE")
 
+    # State
+    state_dir: str = Field("data", env="STATE_DIR")
+    replied_tweets_file: str = Field("data/replied_tweets.json", env="REPLIED_TWEETS_FILE")
+
     # Development
     debug_mode: bool = Field(True, env="DEBUG_MODE")
     testing_mode: bool = Field(False, env="TESTING_MODE")
+    profile_mode: bool = Field(False, env="PROFILE_MODE")  # cProfile SeleniumManager calls
 
     @property
-    def reply_keywords_list(self) -> List[str]:
-        return [kw.strip() for kw in self.reply_keywords.split(',')]
+    def reply_keywords_list(self) -> Tuple[str, ...]:
+        return _split_keywords(self.reply_keywords)
 
     class Config:
         env_file = ".env"
@@ -4,17 +4,35 @@ Utility functions and helpers
 from .logger import setup_logger
 from .helpers import (
     random_delay,
+    human_delay,
     safe_click,
     safe_send_keys,
+    fast_send_keys,
     wait_for_element,
-    wait_for_clickable
+    wait_for_clickable,
+    tweet_key,
+    load_id_set,
+    save_id_set
 )
+from .dedup import BoundedSet, BloomFilter, ScalableBloomFilter
+from .rate_limit import SlidingWindow
+from .action_log import ActionLog
 
 __all__ = [
     'setup_logger',
     'random_delay',
+    'human_delay',
     'safe_click',
     'safe_send_keys',
+    'fast_send_keys',
     'wait_for_element',
-    'wait_for_clickable'
+    'wait_for_clickable',
+    'tweet_key',
+    'load_id_set',
+    'save_id_set',
+    'BoundedSet',
+    'BloomFilter',
+    'ScalableBloomFilter',
+    'SlidingWindow',
+    'ActionLog'
 ]
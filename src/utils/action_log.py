@@ -0,0 +1,58 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterator
+
+
+class ActionLog:
+    """Durable journal of completed actions, one SQLite row per (kind, id)
+
+    Each action is committed as soon as it happens, so a crash or kill
+    between state snapshots can't make the bot reply, follow or like twice.
+    Rows keep the order they were added in; truncate() drops the ones a
+    snapshot already covers, so the journal only holds what came after it.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS journal (seq INTEGER PRIMARY KEY, kind TEXT NOT NULL, "
+            "id TEXT NOT NULL, UNIQUE (kind, id))"
+        )
+
+    def add(self, kind: str, item_id: str) -> bool:
+        """Record an action; returns False if the journal already holds it"""
+        with self._lock:
+            cursor = self._conn.execute("INSERT OR IGNORE INTO journal (kind, id) VALUES (?, ?)", (kind, item_id))
+            return cursor.rowcount == 1
+
+    def __contains__(self, key) -> bool:
+        kind, item_id = key
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM journal WHERE kind = ? AND id = ?", (kind, item_id)
+            ).fetchone() is not None
+
+    def ids(self, kind: str) -> Iterator[str]:
+        """Every id journaled for kind, oldest first"""
+        with self._lock:
+            rows = self._conn.execute("SELECT id FROM journal WHERE kind = ? ORDER BY seq", (kind,)).fetchall()
+        return (row[0] for row in rows)
+
+    def last_seq(self) -> int:
+        """Position of the newest entry - pass it to truncate() once a snapshot covers it"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM journal").fetchone()[0]
+
+    def truncate(self, upto: int):
+        """Drop entries up to and including position upto"""
+        with self._lock:
+            self._conn.execute("DELETE FROM journal WHERE seq <= ?", (upto,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,195 @@
+import os
+import mmap
+import math
+import struct
+import hashlib
+from collections import OrderedDict
+from collections.abc import MutableSet
+from pathlib import Path
+from typing import Hashable, Iterable, Iterator, List, Optional
+
+
+class BoundedSet(MutableSet):
+    """Set that keeps only the `maxsize` most recently added or seen items
+
+    Membership checks refresh an item's recency, so ids that keep showing up
+    outlive ones that were seen once. Lookups and inserts stay O(1).
+    """
+
+    def __init__(self, maxsize: int, items: Optional[Iterable[Hashable]] = None):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[Hashable, None]" = OrderedDict()
+        for item in items or ():
+            self.add(item)
+
+    def __contains__(self, item) -> bool:
+        if item in self._items:
+            self._items.move_to_end(item)
+            return True
+        return False
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate from least to most recently used"""
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: Hashable):
+        self._items[item] = None
+        self._items.move_to_end(item)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def discard(self, item: Hashable):
+        self._items.pop(item, None)
+
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter over str/bytes keys
+
+    Sized for `capacity` items at `error_rate` false positives; no false
+    negatives. Bit positions come from one BLAKE2b digest split into two
+    64-bit hashes (Kirsch-Mitzenmacher double hashing).
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        # bytearray, or a writable memoryview into a file mapped by ScalableBloomFilter.fromfile
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key) -> Iterator[int]:
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, key) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, key) -> bool:
+        """Add key; returns False if it was (probably) already present"""
+        bits = self.bits
+        added = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows by stacking larger filters as it fills
+
+    Each new filter has `growth` times the capacity and half the error rate
+    of the previous one, so the combined false-positive rate stays below
+    `error_rate` however many items are added.
+    """
+
+    _MAGIC = b'SBF1'
+    _HEADER = struct.Struct('<4sI')
+    _FILTER_HEADER = struct.Struct('<QdQQQ')
+
+    def __init__(self, initial_capacity: int = 10_000, error_rate: float = 0.01, growth: int = 4):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.filters: List[BloomFilter] = []
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __contains__(self, key) -> bool:
+        return any(key in f for f in reversed(self.filters))
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self.filters)
+
+    def add(self, key) -> bool:
+        """Add key; returns False if it was (probably) already present"""
+        if key in self:
+            return False
+        current = self.filters[-1] if self.filters else None
+        if current is None or current.count >= current.capacity:
+            if current is None:
+                current = BloomFilter(self.initial_capacity, self.error_rate / 2)
+            else:
+                current = BloomFilter(current.capacity * self.growth, current.error_rate / 2)
+            self.filters.append(current)
+        return current.add(key)
+
+    def _unmap(self):
+        """Copy mapped bit arrays into memory and close the file mapping"""
+        if self._mmap is None:
+            return
+        for bf in self.filters:
+            bf.bits = bytearray(bf.bits)
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # a caller still holds a view; the mapping goes when it does
+        self._mmap = None
+
+    def tofile(self, path: str):
+        """Atomically write the filter to path"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(self._HEADER.pack(self._MAGIC, len(self.filters)))
+            for bf in self.filters:
+                f.write(self._FILTER_HEADER.pack(bf.capacity, bf.error_rate, bf.count, bf.num_bits, bf.num_hashes))
+                f.write(bf.bits)
+        # Windows refuses to replace a file that is still mapped
+        self._unmap()
+        os.replace(tmp, target)
+
+    @classmethod
+    def fromfile(cls, path: str, initial_capacity: int = 10_000, error_rate: float = 0.01) -> "ScalableBloomFilter":
+        """Load a filter written by tofile(), or an empty one if the file is missing or corrupt
+
+        The file is mapped copy-on-write instead of read, so startup cost doesn't
+        grow with the filter size - pages are faulted in as lookups touch them,
+        and changes stay private until the next tofile().
+        """
+        sbf = cls(initial_capacity, error_rate)
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):  # missing, unreadable or empty
+            return sbf
+        data = memoryview(mm)
+        try:
+            magic, num_filters = cls._HEADER.unpack_from(data, 0)
+            if magic != cls._MAGIC:
+                return sbf
+            offset = cls._HEADER.size
+            filters = []
+            for _ in range(num_filters):
+                capacity, rate, count, num_bits, num_hashes = cls._FILTER_HEADER.unpack_from(data, offset)
+                offset += cls._FILTER_HEADER.size
+                bf = BloomFilter(capacity, rate)
+                size = len(bf.bits)
+                if bf.num_bits != num_bits or bf.num_hashes != num_hashes or offset + size > len(data):
+                    return sbf
+                bf.bits = data[offset:offset + size]
+                bf.count = count
+                offset += size
+                filters.append(bf)
+            sbf.filters = filters
+            sbf._mmap = mm
+        except struct.error:
+            pass
+        return sbf
@@ -1,6 +1,11 @@
+import os
+import json
+import math
 import time
 import random
-from typing import Optional
+import hashlib
+from pathlib import Path
+from typing import Iterable, List, Optional
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,6 +16,19 @@ def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
     delay = random.uniform(min_seconds, max_seconds)
     time.sleep(delay)
 
+def human_delay(min_seconds: float, max_seconds: float) -> float:
+    """Random delay in [min, max] skewed toward min (truncated exponential)
+
+    Short pauses are common and long ones rare, like a person's, so the mean
+    wait is well below the midpoint a uniform draw would give.
+    """
+    span = max_seconds - min_seconds
+    if span <= 0:
+        return min_seconds
+    scale = span / 3
+    u = random.random()
+    return min_seconds - scale * math.log(1 - u * (1 - math.exp(-span / scale)))
+
 def safe_click(driver, element: WebElement, max_retries: int = 3) -> bool:
     """Safely click an element with retries"""
     for attempt in range(max_retries):
@@ -35,6 +53,12 @@ def safe_send_keys(element: WebElement, text: str, clear_first: bool = True):
         element.send_keys(char)
         time.sleep(random.uniform(0.05, 0.15))
 
+def fast_send_keys(driver, element: WebElement, text: str):
+    """Insert the whole text in one CDP Input.insertText call instead of per-char keys"""
+    driver.execute_script("arguments[0].focus()", element)
+    driver.execute_cdp_cmd("Input.insertText", {"text": text})
+    time.sleep(random.uniform(0.05, 0.15))
+
 def wait_for_element(driver, by, value, timeout: int = 10) -> Optional[WebElement]:
     """Wait for element to be present and return it"""
     try:
@@ -50,3 +74,29 @@ def wait_for_clickable(driver, by, value, timeout: int = 10) -> Optional[WebElem
         return wait.until(EC.element_to_be_clickable((by, value)))
     except TimeoutException:
         return None
+
+def tweet_key(username: str, text: str) -> str:
+    """Stable dedup key for a tweet - unlike hash(), identical across processes"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(username.encode('utf-8'))
+    h.update(b"\0")
+    h.update(text.encode('utf-8'))
+    return h.hexdigest()
+
+def load_id_set(path: str) -> List[str]:
+    """Load ids saved by save_id_set in their saved order, empty if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            ids = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return [str(item) for item in ids] if isinstance(ids, list) else []
+
+def save_id_set(path: str, ids: Iterable[str]):
+    """Atomically write a set of ids as a JSON list, keeping iteration order"""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(target.suffix + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(list(ids), f)
+    os.replace(tmp, target)
@@ -1,15 +1,70 @@
+import atexit
+import copy
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
 from loguru import logger
 import colorlog
 
-def setup_logger():
+# Formatted file log lines waiting for the writer thread
+_LOG_QUEUE_SIZE = 4096
+# Past this fill, DEBUG/INFO lines are dropped instead of queued
+_DISCARD_FILL = 0.8
+_WARNING_LEVEL = 30
+
+
+class _QueuedFileSink:
+    """Loguru sink that hands formatted lines to a writer thread through a bounded queue
+
+    Once the queue is past _DISCARD_FILL, DEBUG/INFO lines are dropped (and
+    counted) so a burst can't grow memory without bound; WARNING and above
+    wait for room instead.
+    """
+
+    def __init__(self, file_logger, maxsize: int = _LOG_QUEUE_SIZE):
+        self._file_logger = file_logger
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize)
+        self._threshold = int(maxsize * _DISCARD_FILL)
+        self.dropped = 0
+        threading.Thread(target=self._drain, name="log-writer", daemon=True).start()
+
+    def __call__(self, message):
+        if message.record["level"].no >= _WARNING_LEVEL:
+            self._queue.put(str(message))
+            return
+        if self._queue.qsize() >= self._threshold:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait(str(message))
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self):
+        write = self._file_logger.opt(raw=True).info
+        reported = 0
+        while True:
+            write(self._queue.get())
+            if self._queue.empty() and self.dropped != reported:
+                write(f"[logger] {self.dropped - reported} DEBUG/INFO records dropped - log queue was full\n")
+                reported = self.dropped
+            self._queue.task_done()
+
+    def complete(self):
+        """Block until every queued line has been written"""
+        self._queue.join()
+
+
+def setup_logger(log_file: str = "logs/twitter_bot.log"):
     # Remove default loguru handler
     logger.remove()
+    # Independent logger that owns the log file - only the writer thread uses it
+    file_logger = copy.deepcopy(logger)
 
     # Create logs directory
-    Path("logs").mkdir(exist_ok=True)
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
     # Console handler with colors
     logger.add(
@@ -19,13 +74,25 @@ def setup_logger():
         colorize=True
     )
 
-    # File handler
+    # File handler - lines are formatted by the caller and written by a
+    # background thread, so log calls don't wait on disk
+    file_logger.add(
+        log_file,
+        format="{message}",
+        level="INFO",
+        rotation="10 MB",
+        retention="7 days",
+        compression="gz",
+        buffering=8192
+    )
+    file_sink = _QueuedFileSink(file_logger)
     logger.add(
-        "logs/twitter_bot.log",
+        file_sink,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="DEBUG",
-        rotation="10 MB",
-        retention="7 days"
+        level="DEBUG"
     )
+    # Write out queued lines and close the file before the interpreter exits
+    atexit.register(file_logger.remove)
+    atexit.register(file_sink.complete)
 
     return logger
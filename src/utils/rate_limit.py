@@ -0,0 +1,45 @@
+import time
+from collections import deque
+
+
+class SlidingWindow:
+    """At most `limit` actions in any trailing `window` seconds
+
+    Keeps the timestamps of recent actions, so it never allows a full
+    burst right after another one - which is how the site's own hourly
+    throttles count.
+    """
+
+    def __init__(self, limit: int, window: float = 3600):
+        self.limit = limit
+        self.window = window
+        self.times = deque()
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.window
+        times = self.times
+        while times and times[0] <= cutoff:
+            times.popleft()
+
+    def has_tokens(self, n: int = 1) -> bool:
+        """Whether n more actions fit in the window right now"""
+        self._expire()
+        return len(self.times) + n <= self.limit
+
+    def consume(self, n: int = 1) -> bool:
+        """Record n actions if they fit; returns whether they were recorded"""
+        if not self.has_tokens(n):
+            return False
+        now = time.monotonic()
+        self.times.extend([now] * n)
+        return True
+
+    def time_until(self, n: int = 1) -> float:
+        """Seconds until n more actions fit (0 if they already do)"""
+        self._expire()
+        excess = len(self.times) + n - self.limit
+        if excess <= 0:
+            return 0.0
+        if n > self.limit:
+            return float('inf')
+        return max(0.0, self.times[excess - 1] + self.window - time.monotonic())
@@ -1,16 +1,129 @@
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from typing import Optional
+from loguru import logger
 import os
 import sys
 import subprocess
 import signal
+import threading
+import time
+from functools import wraps
 from .config_manager import ConfigManager
 
+try:
+    import orjson
+except ImportError:  # optional - stdlib json is used without it
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, keeping jsonify's sorted keys"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class BotSettingsUpdate(BaseModel):
+    """Bot settings accepted by POST /api/config - all optional, unknown keys dropped"""
+    model_config = ConfigDict(extra='ignore', str_strip_whitespace=True)
+
+    SEARCH_QUERY: Optional[str] = None
+    MAX_REPLIES_PER_DAY: Optional[int] = Field(None, ge=0)
+    MAX_REPLIES_PER_HOUR: Optional[int] = Field(None, ge=0)
+    MIN_DELAY_SECONDS: Optional[int] = Field(None, ge=0)
+    MAX_DELAY_SECONDS: Optional[int] = Field(None, ge=0)
+    ENABLE_AUTO_FOLLOW_BACK: Optional[bool] = None
+    ENABLE_AUTO_LIKE_FOLLOWING: Optional[bool] = None
+    MAX_FOLLOWS_PER_DAY: Optional[int] = Field(None, ge=0)
+    MAX_LIKES_PER_DAY: Optional[int] = Field(None, ge=0)
+    MAX_LIKES_PER_HOUR: Optional[int] = Field(None, ge=0)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 CORS(app)
 
 config_manager = ConfigManager()
+# The bot runs on a thread in this process; BOT_SUBPROCESS=1 runs main.py separately instead
+BOT_IN_PROCESS = not os.getenv('BOT_SUBPROCESS')
 bot_process = None
+bot_instance = None
+_logger_ready = False
+# Set while no bot is running; the bot's thread (or a watcher thread) sets it when the bot exits
+bot_exited = threading.Event()
+bot_exited.set()
+
+
+# path -> (monotonic expiry, JSON body) for GET endpoints the UI polls
+_response_cache = {}
+
+
+def cached_json(ttl: float):
+    """Serve a view's JSON body from memory for ttl seconds; writes clear the cache"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            hit = _response_cache.get(request.path)
+            if hit is None or hit[0] <= now:
+                hit = (now + ttl, app.json.dumps(view(*args, **kwargs)))
+                _response_cache[request.path] = hit
+            return app.response_class(hit[1], mimetype='application/json')
+        return wrapper
+    return decorator
+
+
+def _watch_bot(process: subprocess.Popen):
+    """Block in waitpid until the bot exits - status checks then just read bot_exited"""
+    process.wait()
+    bot_exited.set()
+
+
+def _run_bot(bot):
+    try:
+        bot.run()
+    except Exception as e:
+        logger.error(f"Bot crashed: {e}")
+    finally:
+        bot_exited.set()
+
+
+def _start_bot_thread():
+    """Start the bot in this process - no interpreter startup or re-imports per start"""
+    global bot_instance, _logger_ready
+    from bot.twitter_bot import TwitterBot
+    from config.settings import Settings
+    from utils.logger import setup_logger
+
+    # Same overrides main.py applies from config.json
+    for key, value in config_manager.get_bot_settings().items():
+        os.environ[key] = str(value)
+    if not _logger_ready:
+        setup_logger()
+        _logger_ready = True
+
+    bot_instance = TwitterBot(Settings())
+    bot_exited.clear()
+    threading.Thread(target=_run_bot, args=(bot_instance,), name="twitter-bot", daemon=True).start()
+
+
+def shutdown_bot():
+    """Stop an in-process bot and wait for it to save state and quit its browser
+
+    Called by the server on the way out (web_ui.py, gunicorn's worker_exit) -
+    not from atexit, whose hooks for the chromedriver service and the log file
+    are registered later and so would run first.
+    """
+    if BOT_IN_PROCESS and not bot_exited.is_set():
+        bot_instance.stop()
+        bot_exited.wait(timeout=10)
+
 
 @app.route('/')
 def index():
@@ -19,7 +132,12 @@ def index():
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
-    return jsonify(config_manager.get_config())
+    # Serialized once per config change - no TTL needed. Polls that send back
+    # the ETag get an empty 304 while the config is unchanged
+    body = config_manager.get_config_json()
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(config_manager.get_config_etag())
+    return response.make_conditional(request)
 
 @app.route('/api/config', methods=['POST'])
 def update_config():
@@ -29,43 +147,26 @@ def update_config():
             return jsonify({'status': 'error', 'message': 'Content-Type must be application/json'}), 400
 
         data = request.get_json()
-        if data is None:
+        if not isinstance(data, dict):
             return jsonify({'status': 'error', 'message': 'Invalid JSON data'}), 400
 
         bot_settings = data.get('bot_settings', {})
         if not bot_settings:
             return jsonify({'status': 'error', 'message': 'No bot_settings found in request'}), 400
+        if not isinstance(bot_settings, dict):
+            return jsonify({'status': 'error', 'message': 'bot_settings must be an object'}), 400
 
-        print("Received config update:", bot_settings)
-
-
-        # Validate numeric values
-        numeric_fields = ['MAX_REPLIES_PER_DAY', 'MAX_REPLIES_PER_HOUR', 'MIN_DELAY_SECONDS',
-                        'MAX_DELAY_SECONDS', 'MAX_FOLLOWS_PER_DAY', 'MAX_LIKES_PER_DAY', 'MAX_LIKES_PER_HOUR']
-
-        for field in numeric_fields:
-            if field in bot_settings:
-                try:
-                    bot_settings[field] = int(bot_settings[field])
-                except (ValueError, TypeError):
-                    return jsonify({'status': 'error', 'message': f'Invalid value for {field}'}), 400
-
-        # Validate boolean values
-        boolean_fields = ['ENABLE_AUTO_FOLLOW_BACK', 'ENABLE_AUTO_LIKE_FOLLOWING']
-        for field in boolean_fields:
-            if field in bot_settings:
-                if isinstance(bot_settings[field], str):
-                    bot_settings[field] = bot_settings[field].lower() in ['true', '1', 'yes', 'on']
-                else:
-                    bot_settings[field] = bool(bot_settings[field])
-
-        # Handle string fields
-        if 'SEARCH_QUERY' in bot_settings:
-            bot_settings['SEARCH_QUERY'] = str(bot_settings['SEARCH_QUERY']).strip()
-
+        # Validate and coerce every field in one pass; fields not sent stay unchanged
+        try:
+            bot_settings = BotSettingsUpdate.model_validate(bot_settings).model_dump(exclude_unset=True)
+        except ValidationError as e:
+            loc = e.errors()[0]['loc']
+            message = f'Invalid value for {loc[0]}' if loc else 'Invalid bot_settings'
+            return jsonify({'status': 'error', 'message': message}), 400
 
         # Update configuration
         success = config_manager.update_config({'bot_settings': bot_settings})
+        _response_cache.clear()
         if not success:
             return jsonify({'status': 'error', 'message': 'Failed to save configuration'}), 500
 
@@ -80,14 +181,20 @@ def update_config():
 def start_bot():
     global bot_process
     try:
-        if bot_process and bot_process.poll() is None:
+        if not bot_exited.is_set():
             return jsonify({'status': 'error', 'message': 'Bot is already running'})
 
-        # Start the bot process
-        bot_process = subprocess.Popen([sys.executable, 'main.py'],
-                    cwd=os.path.join(os.path.dirname(__file__), '../..'))
-
-        config_manager.update_config({'bot_status': 'running'})
+        if BOT_IN_PROCESS:
+            _start_bot_thread()
+        else:
+            # Start the bot process
+            bot_process = subprocess.Popen([sys.executable, 'main.py'],
+                        cwd=os.path.join(os.path.dirname(__file__), '../..'))
+            bot_exited.clear()
+            threading.Thread(target=_watch_bot, args=(bot_process,), daemon=True).start()
+
+        config_manager.set_bot_status('running')
+        _response_cache.clear()
         return jsonify({'status': 'success', 'message': 'Bot started successfully'})
 
     except Exception as e:
@@ -97,24 +204,29 @@ def start_bot():
 def stop_bot():
     global bot_process
     try:
-        if bot_process and bot_process.poll() is None:
-            bot_process.terminate()
-            bot_process.wait(timeout=10)
-
-        config_manager.update_config({'bot_status': 'stopped'})
+        if not bot_exited.is_set():
+            if BOT_IN_PROCESS:
+                bot_instance.stop()
+            else:
+                bot_process.terminate()
+            if not bot_exited.wait(timeout=10):
+                raise TimeoutError("Bot did not stop within 10 seconds")
+
+        config_manager.set_bot_status('stopped')
+        _response_cache.clear()
         return jsonify({'status': 'success', 'message': 'Bot stopped successfully'})
 
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/bot/status', methods=['GET'])
+@cached_json(ttl=1)
 def get_bot_status():
-    global bot_process
-    is_running = bot_process and bot_process.poll() is None
+    is_running = not bot_exited.is_set()
     status = 'running' if is_running else 'stopped'
 
-    config_manager.update_config({'bot_status': status})
-    return jsonify({'status': status, 'is_running': is_running})
+    config_manager.set_bot_status(status)
+    return {'status': status, 'is_running': is_running}
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,31 +1,54 @@
+import copy
+import hashlib
 import json
 import os
+from types import MappingProxyType
 from typing import Dict, Any
 
+# Read-only defaults shared by every ConfigManager - merged into fresh dicts, never copied
+DEFAULT_CONFIG = MappingProxyType({
+    "bot_settings": MappingProxyType({
+        "SEARCH_QUERY": "latest news",
+        "MAX_REPLIES_PER_DAY": 50,
+        "MAX_REPLIES_PER_HOUR": 10,
+        "MIN_DELAY_SECONDS": 60,
+        "MAX_DELAY_SECONDS": 180,
+        "ENABLE_AUTO_FOLLOW_BACK": True,
+        "ENABLE_AUTO_LIKE_FOLLOWING": True,
+        "MAX_FOLLOWS_PER_DAY": 20,
+        "MAX_LIKES_PER_DAY": 100,
+        "MAX_LIKES_PER_HOUR": 15
+    }),
+    "bot_status": "stopped"
+})
+
 class ConfigManager:
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
-        self.default_config = {
-            "bot_settings": {
-                "SEARCH_QUERY": "latest news",
-                "MAX_REPLIES_PER_DAY": 50,
-                "MAX_REPLIES_PER_HOUR": 10,
-                "MIN_DELAY_SECONDS": 60,
-                "MAX_DELAY_SECONDS": 180,
-                "ENABLE_AUTO_FOLLOW_BACK": True,
-                "ENABLE_AUTO_LIKE_FOLLOWING": True,
-                "MAX_FOLLOWS_PER_DAY": 20,
-                "MAX_LIKES_PER_DAY": 100,
-                "MAX_LIKES_PER_HOUR": 15
-            },
-            "bot_status": "stopped"
-        }
+        self.default_config = DEFAULT_CONFIG
+        self._mtime = None
+        self._json = None  # serialized self.config, built on first get_config_json
+        self._etag = None
         self.config = self.load_config()
 
+    def _file_mtime(self):
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh(self):
+        """Reload the cached config only if config.json was changed by someone else"""
+        mtime = self._file_mtime()
+        if mtime is not None and mtime != self._mtime:
+            self.config = self.load_config()
+            self._json = None
+
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
         if os.path.exists(self.config_file):
             try:
+                self._mtime = self._file_mtime()
                 with open(self.config_file, 'r') as f:
                     loaded_config = json.load(f)
                     # Merge with defaults to ensure all keys exist
@@ -33,34 +56,35 @@ class ConfigManager:
                     return merged_config
             except (json.JSONDecodeError, Exception) as e:
                 print(f"Error loading config: {e}")
-                return self.default_config.copy()
+                return self._merge_with_defaults({})
         else:
             # Create default config file if it doesn't exist
-            self.save_config(self.default_config)
-            return self.default_config.copy()
+            config = self._merge_with_defaults({})
+            self.save_config(config)
+            return config
 
     def _merge_with_defaults(self, loaded_config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge loaded config with defaults to ensure all required keys exist"""
-        merged = self.default_config.copy()
-
-        # Deep merge bot_settings
-        if 'bot_settings' in loaded_config:
-            merged['bot_settings'].update(loaded_config['bot_settings'])
-
-        # Update other top-level keys
-        for key, value in loaded_config.items():
-            if key != 'bot_settings':
-                merged[key] = value
+        # Fresh dicts throughout, so the defaults are never mutated through the result
+        merged = {**self.default_config, **loaded_config}
+        merged['bot_settings'] = self.default_config['bot_settings'] | loaded_config.get('bot_settings', {})
 
         return merged
 
     def save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
+            # Write a temp file and swap it in, so a crash mid-write can't leave a torn config
+            tmp = self.config_file + '.tmp'
+            with open(tmp, 'w') as f:
                 json.dump(config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.config_file)
             # Update in-memory config after successful save
             self.config = config.copy()
+            self._json = None
+            self._mtime = self._file_mtime()
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -68,13 +92,31 @@ class ConfigManager:
 
     def get_config(self) -> Dict[str, Any]:
         """Get current configuration"""
-        return self.config.copy()
+        self._refresh()
+        return copy.deepcopy(self.config)
+
+    def get_config_json(self) -> bytes:
+        """Current configuration as JSON bytes, serialized once per change"""
+        self._refresh()
+        if self._json is None:
+            self._json = json.dumps(self.config).encode('utf-8')
+            self._etag = hashlib.blake2b(self._json, digest_size=8).hexdigest()
+        return self._json
+
+    def get_config_etag(self) -> str:
+        """ETag of get_config_json()'s bytes"""
+        self.get_config_json()
+        return self._etag
 
     def update_config(self, new_config: Dict[str, Any]) -> bool:
         """Update configuration with new values"""
+        if not new_config:
+            return True
+
         try:
-            # Update in-memory config first
-            updated_config = self.config.copy()
+            # Work on a copy so a failed save leaves the cached config untouched
+            self._refresh()
+            updated_config = copy.deepcopy(self.config)
 
             # Deep update for nested dictionaries
             for key, value in new_config.items():
@@ -83,6 +125,10 @@ class ConfigManager:
                 else:
                     updated_config[key] = value
 
+            # Nothing changed - skip the write
+            if updated_config == self.config:
+                return True
+
             # Save to file and update memory
             if self.save_config(updated_config):
                 return True
@@ -94,6 +140,7 @@ class ConfigManager:
 
     def get_bot_settings(self) -> Dict[str, Any]:
         """Get only bot settings"""
+        self._refresh()
         return self.config.get('bot_settings', {}).copy()
 
     def update_bot_settings(self, new_settings: Dict[str, Any]) -> bool:
@@ -102,8 +149,11 @@ class ConfigManager:
 
     def get_bot_status(self) -> str:
         """Get current bot status"""
+        self._refresh()
         return self.config.get('bot_status', 'stopped')
 
     def set_bot_status(self, status: str) -> bool:
-        """Set bot status"""
+        """Set bot status - a no-op without a disk write if it is unchanged"""
+        if status == self.get_bot_status():
+            return True
         return self.update_config({'bot_status': status})
@@ -1,7 +1,13 @@
 import os
-from google import genai
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from bot.reply_generator import get_client
+
 load_dotenv()
 
 # Get API key directly from environment
@@ -9,8 +15,8 @@ api_key = os.getenv('TWITTER_API_KEY')
 if not api_key:
     raise ValueError("TWITTER_API_KEY not found in .env file")
 
-# Initialize the Gemini client
-client = genai.Client(api_key=api_key)
+# Shared Gemini client - the same one the bot's ReplyGenerator uses
+client = get_client(api_key)
 
 # Generate content using Gemini 2.0 Flash
 response = client.models.generate_content(
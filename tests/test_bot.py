@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from src.bot.twitter_bot import TwitterBot
 from src.config.settings import Settings
 
@@ -19,3 +19,32 @@ class TestTwitterBot:
 
         bot.replies_today = 50
         assert bot._should_continue_today() == False
+
+    def test_prefetch_replies_dedupes_batch(self):
+        bot = TwitterBot(Mock(spec=Settings), test_mode=True)
+        bot.reply_generator = Mock()
+        bot.reply_generator.generate_replies.side_effect = lambda texts, keywords: [f"re: {t}" for t in texts]
+
+        futures = bot._prefetch_replies([('a', 'GM'), ('b', 'hi'), ('a', 'GM'), ('c', 'yo')])
+
+        assert {key: future.result(timeout=5) for key, future in futures.items()} == {
+            'a': 're: GM', 'b': 're: hi', 'c': 're: yo'
+        }
+        bot.reply_generator.generate_replies.assert_called_once_with(['GM', 'hi', 'yo'], ANY)
+
+    def test_failed_prefetch_falls_back_to_inline_reply(self):
+        settings = Mock(spec=Settings)
+        settings.max_replies_per_hour = 10
+        settings.max_replies_per_day = 10
+        bot = TwitterBot(settings, test_mode=True)
+        bot.selenium_manager = Mock()
+        bot.reply_generator = Mock()
+        bot.reply_generator.generate_replies.side_effect = RuntimeError("quota")
+        bot.reply_generator.generate_reply.return_value = "Nice one!"
+
+        futures = bot._prefetch_replies([('a', 'GM'), ('b', 'hi')])
+        with pytest.raises(RuntimeError):
+            futures['b'].result(timeout=5)
+
+        assert bot._process_tweet({'username': 'alice', 'text': 'GM'}, 'a', futures['a'])
+        bot.reply_generator.generate_reply.assert_called_once_with('GM', ANY)
@@ -1,11 +1,87 @@
 import pytest
-from src.utils.helpers import random_delay, safe_click
-import time
+from src.utils.helpers import random_delay, human_delay, safe_click, tweet_key, load_id_set, save_id_set
+from src.utils.dedup import BoundedSet, ScalableBloomFilter
+from src.utils import rate_limit
+from src.utils.action_log import ActionLog
 
-def test_random_delay():
-    start_time = time.time()
+def test_random_delay(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.utils.helpers.time.sleep", sleeps.append)
+    monkeypatch.setattr("src.utils.helpers.random.uniform", lambda a, b: (a + b) / 2)
     random_delay(0.1, 0.2)
-    end_time = time.time()
+    assert sleeps == [pytest.approx(0.15)]
 
-    elapsed = end_time - start_time
-    assert 0.1 <= elapsed <= 0.3  # Allow some tolerance
+def test_human_delay_stays_in_range():
+    delays = [human_delay(5, 15) for _ in range(1000)]
+    assert all(5 <= d <= 15 for d in delays)
+    assert sum(delays) / len(delays) < 10  # skewed toward the minimum
+
+def test_tweet_key_is_stable(tmp_path):
+    key = tweet_key("alice", "hello world")
+    assert key == tweet_key("alice", "hello world")
+    assert key != tweet_key("bob", "hello world")
+    assert len(key) == 32
+
+    path = tmp_path / "state" / "ids.json"
+    save_id_set(str(path), ["z", key, "a"])
+    assert load_id_set(str(path)) == ["z", key, "a"]
+    assert load_id_set(str(tmp_path / "missing.json")) == []
+
+def test_bounded_set_evicts_least_recent():
+    seen = BoundedSet(2)
+    seen.add("a")
+    seen.add("b")
+    assert "a" in seen  # refreshes "a"
+    seen.add("c")
+    assert "b" not in seen
+    assert list(seen) == ["a", "c"]
+
+def test_scalable_bloom_filter_round_trip(tmp_path):
+    seen = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    for i in range(1000):
+        seen.add(f"user{i}")
+    assert all(f"user{i}" in seen for i in range(1000))
+    assert len(seen.filters) > 1
+
+    path = str(tmp_path / "seen.bloom")
+    seen.tofile(path)
+    loaded = ScalableBloomFilter.fromfile(path)
+    assert all(f"user{i}" in loaded for i in range(1000))
+
+def test_sliding_window_blocks_burst_across_boundary(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    window = rate_limit.SlidingWindow(limit=2, window=3600)
+    assert window.consume()
+    now[0] += 600
+    assert window.consume()
+    assert not window.has_tokens()
+
+    now[0] += 60
+    assert window.time_until() == 2940.0
+    now[0] += 2940
+    assert window.consume()
+    assert not window.consume()
+
+def test_action_log_survives_reopen(tmp_path):
+    path = str(tmp_path / "actions.db")
+    log = ActionLog(path)
+    assert log.add("reply", "abc")
+    assert not log.add("reply", "abc")
+    log.close()
+
+    log = ActionLog(path)
+    assert ("reply", "abc") in log
+    assert ("like", "abc") not in log
+    assert list(log.ids("reply")) == ["abc"]
+    log.close()
+
+def test_action_log_replays_in_order_and_truncates(tmp_path):
+    log = ActionLog(str(tmp_path / "actions.db"))
+    for item_id in ("z", "a", "m"):
+        log.add("reply", item_id)
+    mark = log.last_seq()
+    log.add("reply", "b")
+    log.truncate(mark)
+    assert list(log.ids("reply")) == ["b"]
+    log.close()
@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
 import sys
 import os
+import shutil
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from web.app import app
+from web.app import app, shutdown_bot
 
 if __name__ == '__main__':
     print("Starting Twitter Bot Web UI...")
     print("Access the control panel at: http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+
+    if shutil.which('gunicorn') and not os.getenv('DEV'):
+        # gunicorn_conf.py stops the bot from its worker_exit hook
+        here = os.path.dirname(os.path.abspath(__file__))
+        os.execvp('gunicorn', ['gunicorn', '-c', os.path.join(here, 'gunicorn_conf.py'),
+                               '--chdir', here, '--pythonpath', os.path.join(here, 'src'), 'web.app:app'])
+
+    try:
+        if os.getenv('DEV'):
+            # Auto-reload and debugger - development only
+            app.run(debug=True, host='0.0.0.0', port=5000)
+        else:
+            app.run(host='0.0.0.0', port=5000, threaded=True)
+    finally:
+        shutdown_bot()